@@ -0,0 +1,87 @@
+"""
+Microbenchmark of the `EtherscanStream` parse path on a 10,000 rows `txlist` page.
+
+The page is built from the transactions of `sample_files/txlist_response.json`. The single-parse
+pipeline, where `parse_response` and `next_page_token` share the decoded body and the request params,
+is compared with decoding the page for each of them and formatting the method name of every record.
+
+    python benchmarks/parse_page.py
+"""
+import json, logging, pathlib, sys, time
+import requests
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from source_etherscan.source import WalletTransactions, format_method_name
+
+ROWS = 10000
+ROUNDS = 5
+WALLET = "0x1f9840a85d5aF5bf1D1762F925BDADdC4201F984"
+
+def build_page(rows: int) -> bytes:
+    sample = json.loads((ROOT / "sample_files" / "txlist_response.json").read_text())
+    transactions = sample["result"]
+    first_block = int(transactions[0]["blockNumber"])
+    first_timestamp = int(transactions[0]["timeStamp"])
+    result = []
+    for index in range(rows):
+        trx = dict(transactions[index % len(transactions)])
+        trx["blockNumber"] = str(first_block - index)
+        trx["timeStamp"] = str(first_timestamp - index * 12)
+        result.append(trx)
+    return json.dumps({**sample, "result": result}).encode()
+
+def build_response(body: bytes, params: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.request = requests.Request("GET", f"{WalletTransactions.url_base}v2/api", params=params).prepare()
+    return response
+
+def read_page(stream: WalletTransactions, body: bytes, params: dict, stream_slice: dict) -> int:
+    response = build_response(body, params)
+    records = list(stream.parse_response(response, stream_state={}, stream_slice=stream_slice))
+    stream.next_page_token(response)
+    return len(records)
+
+def run(stream: WalletTransactions, body: bytes, params: dict, stream_slice: dict) -> float:
+    best = None
+    for _ in range(ROUNDS):
+        format_method_name.cache_clear()
+        start = time.perf_counter()
+        count = read_page(stream, body, params, stream_slice)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    assert count == ROWS, count
+    return best
+
+def main():
+    logging.getLogger("airbyte").setLevel(logging.ERROR)
+    stream = WalletTransactions(
+        api_key="benchmark",
+        wallets=[{"address": WALLET, "name": "Benchmark", "tags": []}],
+        chain_id="1",
+        backfill=True,
+        sleep_seconds=0,
+        # One more than the page so `next_page_token` stops on the last page
+        pagination_offset=ROWS + 1,
+    )
+    stream_slice = {"chain_id": "1", "address": WALLET, "name": "Benchmark", "tags": [], "start_block": None, "end_block": None}
+    params = {"chainid": "1", "address": WALLET, "sort": "desc", "module": "account", "action": "txlist", "offset": ROWS + 1, "page": 1}
+    body = build_page(ROWS)
+
+    single_parse = run(stream, body, params, stream_slice)
+
+    # Each consumer decodes the body and the URL, method names are formatted for every record
+    stream.get_page = lambda response: (response.json(), stream.get_params(response))
+    stream.camel_to_title = lambda text: format_method_name.__wrapped__(text) if text else None
+    repeated_parse = run(stream, body, params, stream_slice)
+
+    print(f"Page: {ROWS} rows, {len(body) / 1024 / 1024:.1f} MiB, best of {ROUNDS}")
+    print(f"Repeated parse: {repeated_parse * 1000:8.1f} ms  {ROWS / repeated_parse:10.0f} records/s")
+    print(f"Single parse:   {single_parse * 1000:8.1f} ms  {ROWS / single_parse:10.0f} records/s")
+    print(f"Speedup:        {repeated_parse / single_parse:8.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Offline replay benchmark of `SourceEtherscan.read`, one stream at a time.
+
+Etherscan responses are recorded once through a local proxy, then served by a local HTTP stand-in
+so pagination and rate limiting changes can be compared without the live API. Each stream is read
+in its own process and the benchmark reports records/s, requests per record, time spent sleeping
+and peak RSS.
+
+    python benchmarks/replay.py record --config secrets/config.json --output benchmarks/recordings/<name>.json.gz
+    python benchmarks/replay.py replay --recording benchmarks/recordings/sample.json.gz
+    python benchmarks/replay.py replay --recording benchmarks/recordings/sample.json.gz --streams wallet_transactions --concurrent
+"""
+import argparse, gzip, json, logging, pathlib, resource, subprocess, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+import requests
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+UPSTREAM_URL = "https://api.etherscan.io/"
+CATALOG_PATH = ROOT / "sample_files" / "configured_catalog.json"
+# Settings that must not be stored with the recording or that the stand-in does not serve
+REDACTED_SETTINGS = ["api_key", "api_keys", "rpc_urls"]
+
+def request_key(path: str) -> str:
+    """
+    Key of a recorded response, the query parameters without the API key
+    """
+    parsed = urlparse(path)
+    params = {key: value for key, value in parse_qsl(parsed.query) if key != "apikey"}
+    return json.dumps({"path": parsed.path, **params}, sort_keys=True)
+
+class StandIn(ThreadingHTTPServer):
+    """
+    Local Etherscan serving the recorded responses, or forwarding to Etherscan and recording them when `upstream_url` is set
+    """
+    daemon_threads = True
+
+    def __init__(self, responses: dict, upstream_url: str = None):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.responses = responses
+        self.upstream_url = upstream_url
+        self.session = requests.Session()
+        self.requests = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.misses = 0
+
+    def get(self, path: str) -> bytes:
+        key = request_key(path)
+        with self.lock:
+            self.requests += 1
+
+        if self.upstream_url:
+            body = self.session.get(f"{self.upstream_url.rstrip('/')}{path}").content
+            # Rate limited responses are retried by the connector, only the final response is kept
+            if b"rate limit" not in body.lower():
+                with self.lock:
+                    self.responses[key] = body.decode()
+            return body
+
+        body = self.responses.get(key)
+        if body is None:
+            with self.lock:
+                self.misses += 1
+            # An empty page ends the pagination instead of being retried
+            return json.dumps({"status": "0", "message": "No recorded response", "result": []}).encode()
+        return body.encode()
+
+class StandInHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = self.server.get(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+def load_recording(path: pathlib.Path) -> dict:
+    with gzip.open(path, "rt") as file:
+        return json.load(file)
+
+def save_recording(path: pathlib.Path, config: dict, responses: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    config = {key: value for key, value in config.items() if key not in REDACTED_SETTINGS}
+    with gzip.open(path, "wt") as file:
+        json.dump({"config": config, "responses": responses}, file, sort_keys=True)
+
+def get_catalog(streams: list[str]) -> dict:
+    catalog = json.loads(CATALOG_PATH.read_text())
+    catalog["streams"] = [stream for stream in catalog["streams"] if stream["stream"]["name"] in streams]
+    return catalog
+
+def read_streams(url: str, config: dict, streams: list[str]) -> dict:
+    """
+    Read the streams against the stand-in, run in a child process so the peak RSS is the one of this read
+    """
+    from airbyte_cdk.models import ConfiguredAirbyteCatalog
+    from source_etherscan import SourceEtherscan
+    from source_etherscan.source import EtherscanStream
+
+    logging.getLogger("airbyte").setLevel(logging.ERROR)
+    EtherscanStream.url_base = url
+    sleeps = []
+    sleep = time.sleep
+
+    def timed_sleep(seconds: float):
+        sleeps.append(seconds)
+        sleep(seconds)
+
+    time.sleep = timed_sleep
+
+    catalog = ConfiguredAirbyteCatalog.parse_obj(get_catalog(streams))
+    source = SourceEtherscan(catalog, config, None)
+    start = time.perf_counter()
+    records = sum(1 for message in source.read(logging.getLogger("airbyte"), config, catalog, None) if message.type.value == "RECORD")
+    elapsed = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    peak_rss = peak_rss / 1024 if sys.platform != "darwin" else peak_rss / 1024 / 1024
+    return {"records": records, "seconds": elapsed, "sleep_seconds": sum(sleeps), "peak_rss_mib": peak_rss}
+
+def run_child(stand_in: StandIn, config: dict, streams: list[str]) -> dict:
+    stand_in.reset()
+    output = subprocess.run(
+        [sys.executable, __file__, "child", stand_in.url, *streams],
+        input=json.dumps(config),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    result = json.loads(output.stdout.strip().splitlines()[-1])
+    return {**result, "requests": stand_in.requests, "misses": stand_in.misses}
+
+def print_report(results: dict):
+    print(f"{'stream':<32}{'records':>9}{'records/s':>12}{'req/record':>12}{'sleep (s)':>11}{'peak RSS (MiB)':>16}{'misses':>8}")
+    for name, result in results.items():
+        records_per_second = result["records"] / result["seconds"] if result["seconds"] else 0
+        requests_per_record = result["requests"] / result["records"] if result["records"] else float("nan")
+        print(
+            f"{name:<32}{result['records']:>9}{records_per_second:>12.0f}{requests_per_record:>12.3f}"
+            f"{result['sleep_seconds']:>11.1f}{result['peak_rss_mib']:>16.1f}{result['misses']:>8}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Record the Etherscan responses of a read")
+    record.add_argument("--config", required=True, type=pathlib.Path)
+    record.add_argument("--output", required=True, type=pathlib.Path)
+    record.add_argument("--upstream", default=UPSTREAM_URL)
+
+    replay = commands.add_parser("replay", help="Benchmark the streams against the recorded responses")
+    replay.add_argument("--recording", default=ROOT / "benchmarks" / "recordings" / "sample.json.gz", type=pathlib.Path)
+    replay.add_argument("--streams", nargs="*")
+    replay.add_argument("--concurrent", action="store_true", help="Also read every stream at once with `concurrent_streams`")
+    replay.add_argument("--calls-per-second", type=float, help="Override the recorded `calls_per_second`")
+
+    child = commands.add_parser("child")
+    child.add_argument("url")
+    child.add_argument("streams", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "child":
+        print(json.dumps(read_streams(args.url, json.loads(sys.stdin.read()), args.streams)))
+        return
+
+    all_streams = [stream["stream"]["name"] for stream in json.loads(CATALOG_PATH.read_text())["streams"]]
+    if args.command == "record":
+        # Token balances are read from Etherscan, the stand-in does not serve JSON-RPC
+        config = {key: value for key, value in json.loads(args.config.read_text()).items() if key != "rpc_urls"}
+        stand_in = StandIn({}, upstream_url=args.upstream)
+        threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+        for stream in all_streams:
+            result = run_child(stand_in, config, [stream])
+            print(f"{stream}: {result['records']} records, {result['requests']} requests")
+        save_recording(args.output, config, stand_in.responses)
+        print(f"Saved {len(stand_in.responses)} responses to {args.output}")
+        return
+
+    recording = load_recording(args.recording)
+    config = {**recording["config"], "api_key": "replay"}
+    if args.calls_per_second is not None:
+        config["calls_per_second"] = args.calls_per_second
+
+    stand_in = StandIn(recording["responses"])
+    threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+    streams = args.streams or all_streams
+    results = {stream: run_child(stand_in, config, [stream]) for stream in streams}
+    if args.concurrent:
+        results["all (concurrent_streams)"] = run_child(stand_in, {**config, "concurrent_streams": True}, streams)
+
+    print(f"Recording: {args.recording}, {len(recording['responses'])} responses, calls per second: {config.get('calls_per_second')}")
+    print_report(results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import logging, threading, time
+from typing import Optional
+
+logger = logging.getLogger("airbyte")
+
+class ApiKeyPool:
+    """
+    Token bucket per Etherscan API key, shared by every stream of the source.
+
+    `acquire` hands out the key with the most budget left and only waits when every bucket is empty.
+    Without `calls_per_second` the keys are handed out round-robin without waiting.
+    """
+
+    def __init__(self, api_keys: list[str], calls_per_second: Optional[float] = None):
+        if not api_keys:
+            raise ValueError("At least one Etherscan API key is required")
+
+        self.calls_per_second = calls_per_second
+        # Allow a burst of one second of budget per key
+        self.capacity = max(1.0, calls_per_second or 0)
+        now = time.monotonic()
+        self.buckets = [
+            {"api_key": api_key, "tokens": self.capacity, "updated_at": now}
+            for api_key in api_keys
+        ]
+        self.calls = 0
+        self.sleep_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict) -> "ApiKeyPool":
+        """
+        Build the pool from `api_key`, `api_keys` and `calls_per_second`.
+        The budget falls back to one call every `sleep_seconds` per key.
+        """
+        api_keys = [config["api_key"]] + [key for key in config.get("api_keys", []) if key != config["api_key"]]
+        calls_per_second = config.get("calls_per_second")
+        if not calls_per_second and config.get("sleep_seconds"):
+            calls_per_second = 1 / config["sleep_seconds"]
+
+        return cls(api_keys, calls_per_second)
+
+    def __len__(self) -> int:
+        return len(self.buckets)
+
+    def _refill(self, now: float):
+        for bucket in self.buckets:
+            elapsed = now - bucket["updated_at"]
+            bucket["tokens"] = min(self.capacity, bucket["tokens"] + elapsed * self.calls_per_second)
+            bucket["updated_at"] = now
+
+    def acquire(self) -> str:
+        """
+        Take one call from the key with the most budget left, waiting until a key has budget
+        """
+        while True:
+            with self._lock:
+                self.calls += 1
+                if not self.calls_per_second:
+                    return self.buckets[self.calls % len(self.buckets)]["api_key"]
+
+                self._refill(time.monotonic())
+                bucket = max(self.buckets, key=lambda bucket: bucket["tokens"])
+                if bucket["tokens"] >= 1:
+                    bucket["tokens"] -= 1
+                    return bucket["api_key"]
+
+                self.calls -= 1
+                wait = (1 - bucket["tokens"]) / self.calls_per_second
+                self.sleep_seconds += wait
+
+            time.sleep(wait)
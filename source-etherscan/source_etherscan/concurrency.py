@@ -0,0 +1,76 @@
+import copy, threading
+from typing import Any, MutableMapping
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams import Stream
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, FinalStateCursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+
+class SliceGate:
+    """
+    Hold the slices of a stream until the previous one is closed by the concurrent source.
+
+    Streams run in parallel but the slices of each stream are still read one at a time, so block windows
+    are sized from the previous window and the state is only checkpointed for emitted records.
+    """
+
+    def __init__(self):
+        self._closed = threading.Event()
+        self.failed = False
+
+    def wait(self) -> bool:
+        """
+        Wait for the last slice to be closed, `False` if it failed and no more slices should be read
+        """
+        self._closed.wait()
+        self._closed.clear()
+        return not self.failed
+
+    def close(self):
+        self._closed.set()
+
+    def fail(self):
+        self.failed = True
+        self._closed.set()
+
+class StreamStateCursor(Cursor):
+    """
+    Emit the state of an incremental stream each time one of its slices is closed.
+    The stream keeps managing its own state, the cursor only checkpoints it.
+    """
+
+    def __init__(self, stream: Stream, message_repository: MessageRepository, state_manager: ConnectorStateManager):
+        self._stream = stream
+        self._message_repository = message_repository
+        self._state_manager = state_manager
+
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        return self._stream.state
+
+    def observe(self, record) -> None:
+        pass
+
+    def close_partition(self, partition: Partition) -> None:
+        self.emit_state()
+        self._stream.slice_gate.close()
+
+    def ensure_at_least_one_state_emitted(self) -> None:
+        self.emit_state()
+
+    def emit_state(self):
+        # Copied as the stream keeps updating its state while the message is queued
+        self._state_manager.update_state_for_stream(self._stream.name, self._stream.namespace, copy.deepcopy(self.state))
+        self._message_repository.emit_message(self._state_manager.create_state_message(self._stream.name, self._stream.namespace))
+
+class FullRefreshCursor(FinalStateCursor):
+    """
+    Cursor of the streams read in `full_refresh`, only releases the next slice
+    """
+
+    def __init__(self, stream: Stream, message_repository: MessageRepository):
+        super().__init__(stream.name, stream.namespace, message_repository)
+        self._stream = stream
+
+    def close_partition(self, partition: Partition) -> None:
+        self._stream.slice_gate.close()
@@ -0,0 +1,152 @@
+import logging, requests
+from typing import Optional
+
+logger = logging.getLogger("airbyte")
+
+class BalanceOfReader:
+    """
+    Read ERC-20 balances with batched `eth_call balanceOf` requests to a JSON-RPC endpoint.
+
+    The calls are sent as JSON-RPC batch arrays, or aggregated into a single `eth_call`
+    to the Multicall3 contract when `multicall` is enabled.
+    """
+    # balanceOf(address)
+    BALANCE_OF_SELECTOR = "70a08231"
+    # aggregate3((address,bool,bytes)[])
+    AGGREGATE3_SELECTOR = "82ad56cb"
+    # Deployed at the same address on most EVM chains
+    MULTICALL3_ADDRESS = "0xcA11bde05779Ec8315f3aE6BE5e33435D2C38e4"
+    BATCH_SIZE = 100
+    MULTICALL_BATCH_SIZE = 500
+    WORD_SIZE = 64
+
+    def __init__(self, rpc_url: str, multicall: bool = False, session: requests.Session = None):
+        self.rpc_url = rpc_url
+        self.multicall = multicall
+        self.session = session or requests.Session()
+        self.requests = 0
+
+    def balances(self, calls: list[tuple[str, str]]) -> list[Optional[int]]:
+        """
+        Get the balance of each `(token_address, wallet_address)` call, `None` if the call failed
+        """
+        batch_size = self.MULTICALL_BATCH_SIZE if self.multicall else self.BATCH_SIZE
+        balances = []
+        for index in range(0, len(calls), batch_size):
+            batch = calls[index:index + batch_size]
+            balances += self.multicall_balances(batch) if self.multicall else self.batch_balances(batch)
+        return balances
+
+    def post(self, payload):
+        self.requests += 1
+        response = self.session.post(self.rpc_url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def batch_balances(self, calls: list[tuple[str, str]]) -> list[Optional[int]]:
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": index,
+                "method": "eth_call",
+                "params": [{"to": token_address, "data": self.encode_balance_of(wallet_address)}, "latest"]
+            }
+            for index, (token_address, wallet_address) in enumerate(calls)
+        ]
+        # Responses of a batch may come in any order
+        results = {item.get("id"): item for item in self.post(payload)}
+        balances = []
+        for index, call in enumerate(calls):
+            item = results.get(index, {})
+            if "error" in item:
+                logger.warning(f"BalanceOfReader > eth_call {call}: {item['error']}")
+            balances.append(self.decode_uint(item.get("result")))
+        return balances
+
+    def multicall_balances(self, calls: list[tuple[str, str]]) -> list[Optional[int]]:
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "eth_call",
+            "params": [{"to": self.MULTICALL3_ADDRESS, "data": self.encode_aggregate3(calls)}, "latest"]
+        }
+        output = self.post(payload)
+        if "error" in output:
+            raise requests.HTTPError(f"Multicall3 aggregate3 failed: {output['error']}")
+
+        balances = []
+        for call, (success, return_data) in zip(calls, self.decode_aggregate3(output["result"])):
+            balance = self.decode_uint(return_data) if success else None
+            if not success:
+                logger.warning(f"BalanceOfReader > aggregate3 {call}: call failed")
+            elif balance is None:
+                logger.warning(f"BalanceOfReader > aggregate3 {call}: invalid return data {return_data}")
+            balances.append(balance)
+        return balances
+
+    def encode_balance_of(self, wallet_address: str) -> str:
+        return f"0x{self.BALANCE_OF_SELECTOR}{self.encode_address(wallet_address)}"
+
+    def encode_address(self, address: str) -> str:
+        return address.lower().removeprefix("0x").rjust(self.WORD_SIZE, "0")
+
+    def encode_uint(self, value: int) -> str:
+        return f"{value:064x}"
+
+    def encode_aggregate3(self, calls: list[tuple[str, str]]) -> str:
+        """
+        ABI encode `aggregate3` with one `(target, allowFailure=true, balanceOf(wallet))` tuple per call
+        """
+        # The balanceOf call data is 36 bytes, padded to 64
+        call_data_size = 36
+        call_data_words = 2
+        # target, allowFailure, call data offset, call data length and call data
+        tuple_size = (4 + call_data_words) * 32
+
+        offsets = "".join(self.encode_uint(len(calls) * 32 + index * tuple_size) for index in range(len(calls)))
+        tuples = "".join(
+            self.encode_address(token_address)
+            + self.encode_uint(1)
+            + self.encode_uint(3 * 32)
+            + self.encode_uint(call_data_size)
+            + self.encode_balance_of(wallet_address).removeprefix("0x").ljust(call_data_words * self.WORD_SIZE, "0")
+            for token_address, wallet_address in calls
+        )
+        return f"0x{self.AGGREGATE3_SELECTOR}{self.encode_uint(32)}{self.encode_uint(len(calls))}{offsets}{tuples}"
+
+    def decode_aggregate3(self, data: str) -> list[tuple[bool, str]]:
+        """
+        ABI decode the `(bool success, bytes returnData)[]` returned by `aggregate3`
+        """
+        data = data.removeprefix("0x")
+
+        def word(position: int) -> int:
+            if len(data) < position * 2 + self.WORD_SIZE:
+                raise ValueError(f"Multicall3 aggregate3 result is truncated at byte {position}")
+            return int(data[position * 2:position * 2 + self.WORD_SIZE], 16)
+
+        array_start = word(0)
+        count = word(array_start)
+        # Tuple offsets are relative to the first offset, right after the array length
+        items_start = array_start + 32
+        results = []
+        for index in range(count):
+            tuple_start = items_start + word(items_start + index * 32)
+            success = bool(word(tuple_start))
+            bytes_start = tuple_start + word(tuple_start + 32)
+            length = word(bytes_start)
+            if len(data) < (bytes_start + 32 + length) * 2:
+                raise ValueError(f"Multicall3 aggregate3 result is truncated at byte {bytes_start}")
+            return_data = data[(bytes_start + 32) * 2:(bytes_start + 32 + length) * 2]
+            results.append((success, f"0x{return_data}"))
+        return results
+
+    def decode_uint(self, value: Optional[str]) -> Optional[int]:
+        """
+        Decode the uint256 returned by `balanceOf`, `None` when the return data is shorter than a word,
+        e.g. the address is not a contract or does not implement `balanceOf`
+        """
+        value = (value or "").removeprefix("0x")
+        if len(value) < self.WORD_SIZE:
+            return None
+        return int(value[:self.WORD_SIZE], 16)
@@ -5,9 +5,23 @@
 
 import sys
 
-from airbyte_cdk.entrypoint import launch
+from airbyte_cdk.entrypoint import AirbyteEntrypoint, launch
 from .source import SourceEtherscan
 
+def get_source(args: list[str]) -> SourceEtherscan:
+    """
+    The concurrent read needs the catalog and the state before `read` is called
+    """
+    catalog_path = AirbyteEntrypoint.extract_catalog(args)
+    config_path = AirbyteEntrypoint.extract_config(args)
+    state_path = AirbyteEntrypoint.extract_state(args)
+    return SourceEtherscan(
+        SourceEtherscan.read_catalog(catalog_path) if catalog_path else None,
+        SourceEtherscan.read_config(config_path) if config_path else None,
+        SourceEtherscan.read_state(state_path) if state_path else None
+    )
+
 def run():
-    source = SourceEtherscan()
-    launch(source, sys.argv[1:])
+    args = sys.argv[1:]
+    source = get_source(args)
+    launch(source, args)
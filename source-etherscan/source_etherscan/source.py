@@ -1,26 +1,63 @@
-import requests, logging, re, datetime, time
+import requests, logging, re, datetime, time, json, queue, threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qsl
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
-from airbyte_cdk.sources import AbstractSource
-from airbyte_cdk.sources.streams import Stream
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from airbyte_cdk.sources.concurrent_source.concurrent_source import ConcurrentSource
+from airbyte_cdk.sources.concurrent_source.concurrent_source_adapter import ConcurrentSourceAdapter
+from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
+from airbyte_cdk.sources.streams import Stream, IncrementalMixin
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
 from airbyte_cdk.sources.streams.http import HttpStream
-from airbyte_cdk.models import SyncMode
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, FailureType, SyncMode
+from airbyte_cdk.utils import AirbyteTracedException
+from .api_keys import ApiKeyPool
+from .concurrency import FullRefreshCursor, SliceGate, StreamStateCursor
+from .rpc import BalanceOfReader
+
+def get_chain_ids(chain_id: Union[str, list]) -> list[str]:
+    """
+    Get the list of chains from a single chain id, a comma separated list or a list
+    """
+    chain_ids = chain_id if isinstance(chain_id, list) else str(chain_id).split(",")
+    return [str(chain).strip() for chain in chain_ids if str(chain).strip()]
+
+# Marker yielded after the records of each fully read page of a block window
+PageEnd = namedtuple("PageEnd", ["page"])
+
+CAMEL_CASE_PATTERN = re.compile(r'(?<!^)(?=[A-Z])')
+
+@lru_cache(maxsize=4096)
+def format_method_name(method_call: str) -> str:
+    """
+    Convert transaction Method information into etherscan.io format, memoized as the same methods repeat across transactions
+    """
+    name = method_call.split("(", 1)[0]
+    name = CAMEL_CASE_PATTERN.sub(" ", name)
+    name = name.replace("_", " ")
+    return name.title()
 
 class EtherscanStream(HttpStream):
     url_base = "https://api.etherscan.io/"
     WEI_DECIMALS = 18
     GWEI_DECIMALS = 9
     EMPTY_ADDRESS = "0x0000000000000000000000000000000000000000"
+    # Etherscan rejects requests where `page * offset` exceeds this number of records
+    MAX_RESULT_WINDOW = 10000
 
     primary_key = None
     cursor_field = []
 
-    def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, **kwargs):
+    def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, api_key_pool: ApiKeyPool = None, **kwargs):
         super().__init__()
         self.api_key = api_key
+        # Shared by every stream so the request budget applies to the whole source
+        self.api_key_pool = api_key_pool or ApiKeyPool.from_config({"api_key": api_key, "sleep_seconds": sleep_seconds})
         self.wallets = wallets
-        self.chain_id = chain_id
+        self.chain_ids = get_chain_ids(chain_id)
         self.pagination_offset = pagination_offset
+        self.backfill = backfill
         self.wallet_info = {
             wallet["address"]: {
                 "tags": wallet["tags"],
@@ -28,9 +65,11 @@ class EtherscanStream(HttpStream):
             }
             for wallet in self.wallets
         }
+        # Etherscan may return the addresses lowercased
+        self.wallet_index = {wallet["address"].lower(): wallet["address"] for wallet in self.wallets}
         self.is_balance_stream = self.name.endswith('balance')
         self.sleep_seconds = sleep_seconds
-        self.logger.info(f"{self.name} > Sleep per request: {self.sleep_seconds}s")
+        self.logger.info(f"{self.name} > API keys: {len(self.api_key_pool)}, calls per second per key: {self.api_key_pool.calls_per_second}")
 
         yesterday = datetime.datetime.now().date() - datetime.timedelta(days=1)
         # Syncing since Ethereum first transaction
@@ -43,25 +82,116 @@ class EtherscanStream(HttpStream):
             }
             for wallet in self.wallets
         }
+        # Records of the slices read ahead by `read_chains`
+        self._prefetched = {}
+        # Set when the stream is read by the concurrent source
+        self.slice_gate: Optional[SliceGate] = None
+
+    @property
+    def availability_strategy(self):
+        # Skip the probe request on the first slice
+        return None
 
     def stream_slices(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Optional[Mapping[str, Any]]]:
 
+        if len(self.chain_ids) == 1:
+            stream_slices = self.chain_slices(self.chain_ids[0], sync_mode, cursor_field, stream_state)
+        else:
+            stream_slices = self.read_chains(sync_mode, cursor_field, stream_state)
+
+        for stream_slice in stream_slices:
+            yield stream_slice
+            # The concurrent source reads the next slice once this one is closed
+            if self.slice_gate and not self.slice_gate.wait():
+                return
+
+    def chain_slices(self, chain_id: str, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Slices of a single chain, one per wallet
+        """
         for wallet in self.wallets:
             selected = self.historical_mapping[wallet["address"]]
-            msg = f"{self.name} > stream_slice: Fetching data for {wallet['name']}" + ("" if self.is_balance_stream else f" from {selected['start_date']} to {selected['end_date']}")
+            msg = f"{self.name} > stream_slice: Fetching data for {wallet['name']} on chain {chain_id}" + ("" if self.is_balance_stream else f" from {selected['start_date']} to {selected['end_date']}")
             self.logger.info(msg)
-            time.sleep(self.sleep_seconds)
             yield {
+                "chain_id": chain_id,
                 "address": wallet["address"],
                 "name": wallet["name"],
                 "tags": wallet["tags"],
             }
 
+    def read_chains(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Read the slices of every chain concurrently, one thread per chain.
+        Each slice is yielded once its records are fetched and `read_records` replays them,
+        so the state is only checkpointed for records that were emitted. The queue holds a
+        few slices per chain so a slow destination pauses the threads.
+        """
+        output = queue.Queue(maxsize=2 * len(self.chain_ids))
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    output.put(item, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_chain(chain_id: str):
+            try:
+                for stream_slice in self.chain_slices(chain_id, sync_mode, cursor_field, stream_state):
+                    if stop.is_set():
+                        return
+                    records = list(self.read_slice(sync_mode, cursor_field, stream_slice, stream_state))
+                    put((stream_slice, records))
+            finally:
+                put((chain_id, None))
+
+        with ThreadPoolExecutor(max_workers=len(self.chain_ids), thread_name_prefix=self.name) as executor:
+            futures = {chain_id: executor.submit(read_chain, chain_id) for chain_id in self.chain_ids}
+            try:
+                remaining = len(futures)
+                while remaining:
+                    stream_slice, records = output.get()
+                    if records is None:
+                        remaining -= 1
+                        # Raise the exception of the chain thread, if any
+                        futures[stream_slice].result()
+                        continue
+
+                    self._prefetched[self.slice_key(stream_slice)] = records
+                    yield stream_slice
+            finally:
+                stop.set()
+
+    def read_records(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        records = self._prefetched.pop(self.slice_key(stream_slice), None) if stream_slice else None
+        try:
+            if records is None:
+                yield from self.read_slice(sync_mode, cursor_field, stream_slice, stream_state)
+            else:
+                yield from records
+        except Exception:
+            # A failed slice is never closed, stop generating slices
+            if self.slice_gate:
+                self.slice_gate.fail()
+            raise
+
+    def read_slice(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Fetch the records of a slice from the Etherscan API
+        """
+        yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+    def slice_key(self, stream_slice: Mapping[str, Any]) -> str:
+        return json.dumps(stream_slice, sort_keys=True)
+
     def path(self, **kwargs) -> str:
         return "v2/api"
 
     def backoff_time(self, response: requests.Response) -> Optional[float]:
-        output: dict = response.json()
+        output, _ = self.get_page(response)
         result = output.get("result")
         if not result:
             return None
@@ -82,27 +212,40 @@ class EtherscanStream(HttpStream):
         if self.is_balance_stream:
             return None
 
-        result = response.json().get("result", [])
+        data, params = self.get_page(response)
+        result = data.get("result", [])
         if isinstance(result, str):
             seconds = self.backoff_time(response)
             time.sleep(seconds)
             # Retry same page
-            current_page = int(self.get_params(response).get("page", 1))
+            current_page = int(params.get("page", 1))
             return {"page": current_page}
 
         if not result:
             return None
 
-        params = self.get_params(response)
         current_page = int(params.get("page", 1))
         # Last page may have less records
         if len(result) < self.pagination_offset:
             return None
 
-        to_lower = lambda result: {key.lower(): value for key, value in result.items()}
-        earliest_date = self.to_datetime(to_lower(result[-1])["timestamp"])
-        params = {"page": current_page + 1} if self.is_valid(params["address"], earliest_date) else None
-        time.sleep(self.sleep_seconds)
+        if self.is_last_allowed_page(current_page):
+            self.logger.warning(f"{self.name} > next_page_token: {params['address']} reached the {self.MAX_RESULT_WINDOW} records limit")
+            return None
+
+        # Block range requests are sorted ascending, every page of the window is needed
+        if params.get("sort") == "asc":
+            return {"page": current_page + 1}
+
+        if "startblock" in params:
+            # Endpoints without block range are read newest first until the stored block
+            is_valid = int(result[-1]["blockNumber"]) >= int(params["startblock"])
+        else:
+            to_lower = lambda result: {key.lower(): value for key, value in result.items()}
+            earliest_date = self.to_datetime(to_lower(result[-1])["timestamp"])
+            is_valid = self.is_valid(params["address"], earliest_date)
+
+        params = {"page": current_page + 1} if is_valid else None
         return params
 
     def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, any] = None, next_page_token: Mapping[str, Any] = None) -> MutableMapping[str, Any]:
@@ -110,22 +253,33 @@ class EtherscanStream(HttpStream):
             return {}
 
         params = {
-            "chainid": self.chain_id,
+            "chainid": stream_slice["chain_id"],
             "address": stream_slice["address"],
-            "apikey": self.api_key,
+            "apikey": self.api_key_pool.acquire(),
             "sort": "desc",
             "module": "account",
             "offset": self.pagination_offset,
-            "page": next_page_token["page"] if next_page_token else 1
+            "page": next_page_token["page"] if next_page_token else stream_slice.get("start_page", 1)
         }
         if self.is_balance_stream:
             params.pop("sort")
             params.pop("offset")
             params.pop("page")
+        elif stream_slice.get("start_block") is not None:
+            params["startblock"] = stream_slice["start_block"]
+            if stream_slice.get("end_block") is not None:
+                params["endblock"] = stream_slice["end_block"]
+                params["sort"] = "asc"
 
         self.logger.info(f"{self.name} > request_params: {params}")
         return params
 
+    def is_last_allowed_page(self, page: int) -> bool:
+        """
+        Check if the next page would exceed the `MAX_RESULT_WINDOW` records returned by Etherscan
+        """
+        return (page + 1) * self.pagination_offset > self.MAX_RESULT_WINDOW
+
     def to_datetime(self, timestamp: str) -> datetime.datetime:
         """
         Convert the default Etherscan timestamp to a `datetime`
@@ -155,6 +309,16 @@ class EtherscanStream(HttpStream):
         parsed_url = urlparse(response.request.path_url)
         return dict(parse_qsl(parsed_url.query))
 
+    def get_page(self, response: requests.Response) -> Tuple[dict, dict]:
+        """
+        Get the decoded body and the request parameters of the response.
+        Both are parsed once and shared by `backoff_time`, `next_page_token` and `parse_response`
+        """
+        page = getattr(response, "_etherscan_page", None)
+        if page is None:
+            page = response._etherscan_page = (response.json(), self.get_params(response))
+        return page
+
     def camel_to_title(self, text: str) -> str:
         """
         Convert transaction Method information into etherscan.io format
@@ -162,22 +326,289 @@ class EtherscanStream(HttpStream):
         if len(text) == 0:
             return None
 
-        name = text.split("(", 1)[0]
-        name = re.sub(r'(?<!^)(?=[A-Z])', ' ', name)
-        name = name.replace("_", " ")
-        return name.title()
+        return format_method_name(text)
+
+    def get_movement(self, wallet_address: str, from_address: str, to_address: str) -> Optional[str]:
+        """
+        Get the direction of the transaction, `wallet_address` must be lowercase
+        """
+        if from_address.lower() == wallet_address:
+            return "out"
+        elif to_address.lower() == wallet_address:
+            return "in"
+        return None
 
     def get_transactions(self, response: requests.Response) -> list:
         """
         Get the transactions from the current request.
-        Avoids `TypeError: 'NoneType' object is not iterable`
+        Avoids `TypeError: 'NoneType' object is not iterable` and error messages returned as `result`
         """
-        data: dict = response.json()
+        data, _ = self.get_page(response)
         txs: list[dict] = data.get("result", [])
-        txs = txs if txs else []
+        txs = txs if isinstance(txs, list) else []
         return txs
 
-class WalletTransactions(EtherscanStream):
+class IncrementalEtherscanStream(EtherscanStream, IncrementalMixin):
+    """
+    Wallet activity stream that keeps the highest synced block per chain and wallet in the state:
+    `{"<chain id>": {"<wallet address>": {"block": 123}}}`
+
+    Wallets with a stored block, or every wallet when `backfill` is enabled, are read in `startblock/endblock`
+    windows up to the latest block. Wallets without a stored block otherwise use the `backfill` date window.
+
+    While a window is read, the state also keeps the last fully emitted page,
+    `{"block": 123, "position": {"start_block": 124, "end_block": 224, "page": 3}}`,
+    so a restarted sync resumes from the next page of that window.
+    """
+    cursor_field = "block"
+    # Endpoint accepts `startblock`, `endblock` and `sort`
+    supports_block_range = True
+    DEFAULT_BLOCK_WINDOW = 100000
+
+    def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, block_window: int = DEFAULT_BLOCK_WINDOW, checkpoint_interval: int = None, **kwargs):
+        super().__init__(api_key, wallets, chain_id, backfill, sleep_seconds, pagination_offset, **kwargs)
+        self.block_window = block_window
+        # Checkpoint about once per page by default
+        self.checkpoint_interval = checkpoint_interval or pagination_offset
+        self.latest_blocks = {}
+        # Feedback of each window slice, used to size the next one
+        self.windows = {}
+        self._state = {}
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return self.checkpoint_interval
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return self._state
+
+    @state.setter
+    def state(self, value: Mapping[str, Any]):
+        value = dict(value or {})
+        # State of a single chain, keyed by wallet
+        if any(self.cursor_field in wallet_state for wallet_state in value.values() if isinstance(wallet_state, dict)):
+            value = {self.chain_ids[0]: value}
+        self._state = value
+
+    def get_wallet_state(self, chain_id: str, wallet_address: str) -> dict:
+        return self._state.setdefault(chain_id, {}).setdefault(wallet_address, {})
+
+    def get_last_block(self, chain_id: str, wallet_address: str) -> Optional[int]:
+        wallet_state = self._state.get(chain_id, {}).get(wallet_address) or {}
+        block = wallet_state.get(self.cursor_field)
+        return int(block) if block is not None else None
+
+    def set_last_block(self, chain_id: str, wallet_address: str, block: int):
+        """
+        Store the block synced so far, the wallet has no window in progress anymore
+        """
+        last_block = self.get_last_block(chain_id, wallet_address)
+        wallet_state = self.get_wallet_state(chain_id, wallet_address)
+        wallet_state.pop("position", None)
+        if last_block is None or block > last_block:
+            wallet_state[self.cursor_field] = block
+
+    def set_position(self, stream_slice: Mapping[str, Any], page: int):
+        """
+        Store the last page of the window whose records were all emitted
+        """
+        self.get_wallet_state(stream_slice["chain_id"], stream_slice["address"])["position"] = {
+            "start_block": stream_slice["start_block"],
+            "end_block": stream_slice["end_block"],
+            "page": page
+        }
+
+    def get_latest_block(self, chain_id: str) -> int:
+        """
+        Get the latest block of the chain, fetched once per sync.
+        Gives up after `max_retries` retries, e.g. on an invalid API key or an unsupported chain
+        """
+        attempts = 0
+        while self.latest_blocks.get(chain_id) is None:
+            params = {
+                "chainid": chain_id,
+                "module": "proxy",
+                "action": "eth_blockNumber",
+                "apikey": self.api_key_pool.acquire()
+            }
+            response = self._session.get(f"{self.url_base}{self.path()}", params=params)
+            try:
+                output = response.json()
+                result = str(output.get("result"))
+                message = f"{output.get('message')}: {result}" if output.get("message") else result
+            except ValueError:
+                result = ""
+                message = f"HTTP {response.status_code}: {response.text[:200]}"
+
+            if result.startswith("0x"):
+                self.latest_blocks[chain_id] = int(result, 16)
+                self.logger.info(f"{self.name} > get_latest_block: {self.latest_blocks[chain_id]} on chain {chain_id}")
+                continue
+
+            self.logger.warning(f"{self.name} > get_latest_block: {message}")
+            attempts += 1
+            if attempts > (self.max_retries or 0):
+                raise AirbyteTracedException(
+                    internal_message=f"eth_blockNumber failed on chain {chain_id} after {attempts} attempts: {message}",
+                    message=f"Could not get the latest block of chain {chain_id} from Etherscan: {message}. Please check the API key and the chain id.",
+                    failure_type=FailureType.config_error,
+                )
+            time.sleep(self.sleep_seconds)
+
+        return self.latest_blocks[chain_id]
+
+    def chain_slices(self, chain_id: str, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+
+        for stream_slice in super().chain_slices(chain_id, sync_mode, cursor_field, stream_state):
+            is_incremental = sync_mode == SyncMode.incremental
+            last_block = self.get_last_block(chain_id, stream_slice["address"]) if is_incremental else None
+            start_block = last_block + 1 if last_block is not None else None
+            wallet_state = self._state.get(chain_id, {}).get(stream_slice["address"]) or {}
+            position = wallet_state.get("position") if is_incremental and self.supports_block_range else None
+            if position:
+                self.logger.info(f"{self.name} > stream_slice: {stream_slice['name']} resuming from block {position['start_block']} page {position['page'] + 1}")
+                yield from self.block_windows(stream_slice, position["start_block"], position)
+                continue
+
+            if self.supports_block_range and (start_block is not None or self.backfill):
+                # Syncing since the genesis block
+                yield from self.block_windows(stream_slice, start_block or 0)
+                continue
+
+            if start_block is not None:
+                self.logger.info(f"{self.name} > stream_slice: {stream_slice['name']} from block {start_block}")
+
+            yield {
+                **stream_slice,
+                "start_block": start_block,
+                "end_block": None
+            }
+
+    def block_windows(self, stream_slice: Mapping[str, Any], start_block: int, position: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Split the blocks from `start_block` to the latest block into `startblock/endblock` slices.
+        A window that reaches `MAX_RESULT_WINDOW` is resumed from its last block with half the size,
+        a window with few records doubles the size of the next one.
+        An interrupted window from `position` is read again from the page after the stored one.
+        """
+        latest_block = self.get_latest_block(stream_slice["chain_id"])
+        window_size = self.block_window
+        while start_block <= latest_block:
+            end_block = min(start_block + window_size - 1, latest_block)
+            window_slice = {
+                **stream_slice,
+                "start_block": start_block,
+                "end_block": end_block
+            }
+            if position:
+                window_slice["end_block"] = end_block = position["end_block"]
+                window_slice["start_page"] = position["page"] + 1
+                position = None
+
+            window = self.windows[self.slice_key(window_slice)] = {"records": 0, "resume_block": None}
+            self.logger.info(f"{self.name} > block_windows: {stream_slice['name']} from block {start_block} to {end_block} on chain {stream_slice['chain_id']}")
+            yield window_slice
+
+            if window["resume_block"] is not None:
+                start_block = window["resume_block"]
+                window_size = max(window_size // 2, 1)
+                continue
+
+            if window["records"] < self.MAX_RESULT_WINDOW // 4:
+                window_size *= 2
+            start_block = end_block + 1
+
+    def iter_transactions(self, response: requests.Response, stream_slice: Mapping[str, Any], timestamp_key: str = "timeStamp") -> Iterable[Tuple[dict, datetime.datetime]]:
+        """
+        Yield the transactions of the current request with their `datetime`.
+        The date window only applies to requests without a start block
+        """
+        wallet_address = stream_slice["address"]
+        start_block = stream_slice.get("start_block")
+        txs = self.get_transactions(response)
+
+        if stream_slice.get("end_block") is not None:
+            window = self.windows[self.slice_key(stream_slice)]
+            _, params = self.get_page(response)
+            page = int(params.get("page", 1))
+            if len(txs) == self.pagination_offset and self.is_last_allowed_page(page):
+                # The next window starts again from the last block, which may be incomplete in this page
+                last_block = int(txs[-1]["blockNumber"])
+                if last_block > start_block:
+                    txs = [trx for trx in txs if int(trx["blockNumber"]) < last_block]
+                    window["resume_block"] = last_block
+            window["records"] += len(txs)
+
+        for trx in txs:
+            timestamp = self.to_datetime(trx[timestamp_key])
+            if start_block is None:
+                if self.has_finished(wallet_address, timestamp):
+                    break
+
+                if not self.is_valid(wallet_address, timestamp):
+                    continue
+
+            elif int(trx["blockNumber"]) < start_block:
+                break
+
+            yield trx, timestamp
+
+    def read_slice(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        """
+        Fetch the records of a slice, window slices yield a `PageEnd` after the records of each page
+        """
+        if not stream_slice or stream_slice.get("end_block") is None:
+            yield from super().read_slice(sync_mode, cursor_field, stream_slice, stream_state)
+            return
+
+        def parse_page(request: requests.PreparedRequest, response: requests.Response, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any]) -> Iterable[Any]:
+            yield from self.parse_response(response, stream_slice=stream_slice, stream_state=stream_state)
+            data, params = self.get_page(response)
+            # Error messages are retried on the same page
+            if isinstance(data.get("result"), list):
+                yield PageEnd(int(params.get("page", 1)))
+
+        yield from self._read_pages(parse_page, stream_slice, stream_state)
+
+    def read_records(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+        if not stream_slice:
+            yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+            return
+
+        chain_id, wallet_address = stream_slice["chain_id"], stream_slice["address"]
+        window = self.windows.get(self.slice_key(stream_slice)) if stream_slice.get("end_block") is not None else None
+        latest_block = None
+        # Each record is emitted once the next one is read, so a checkpoint taken on the last record of a page includes its position
+        pending = None
+        for record in super().read_records(sync_mode, cursor_field, stream_slice, stream_state):
+            if isinstance(record, PageEnd):
+                if window["resume_block"] is not None:
+                    # The page reached `MAX_RESULT_WINDOW`, the rest of the window is read from the resume block
+                    self.set_last_block(chain_id, wallet_address, window["resume_block"] - 1)
+                else:
+                    self.set_position(stream_slice, record.page)
+                if pending is not None:
+                    yield pending
+                    pending = None
+                continue
+
+            if pending is not None:
+                yield pending
+            pending = record
+            latest_block = max(latest_block or 0, record["block"])
+
+        if window is not None:
+            # A completed window is synced up to its end block, even without records
+            self.set_last_block(chain_id, wallet_address, window["resume_block"] - 1 if window["resume_block"] is not None else stream_slice["end_block"])
+        elif latest_block is not None:
+            # Records are read newest first, the block is only stored once the slice is complete
+            self.set_last_block(chain_id, wallet_address, latest_block)
+
+        if pending is not None:
+            yield pending
+
+class WalletTransactions(IncrementalEtherscanStream):
     """
     A transaction where an EOA (Externally Owned Address, or typically referred to as a wallet address) sends ETH directly to another EOA.
     When viewing an address on Etherscan, this type of transaction will be shown under the Transaction tab.
@@ -193,22 +624,14 @@ class WalletTransactions(EtherscanStream):
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        txs = self.get_transactions(response)
-        params = self.get_params(response)
-        selected = self.wallet_info.get(params["address"], {})
-
-        for trx in txs:
-            timestamp = self.to_datetime(trx["timeStamp"])
-            if self.has_finished(params["address"], timestamp):
-                break
-
-            if not self.is_valid(params["address"], timestamp):
-                continue
+        selected = self.wallet_info.get(stream_slice["address"], {})
+        wallet_address = stream_slice["address"].lower()
 
+        for trx, timestamp in self.iter_transactions(response, stream_slice):
             method_call = trx["functionName"] if len(trx["functionName"]) > 0 else None
 
             point = {
-                "wallet_address": params["address"],
+                "wallet_address": stream_slice["address"],
                 "wallet_name": selected["name"],
                 "tags": selected["tags"],
                 "hash": trx["hash"],
@@ -221,7 +644,7 @@ class WalletTransactions(EtherscanStream):
                 "token_name": "Ethereum",
                 "token_symbol": "ETH",
                 "token_decimal": self.WEI_DECIMALS,
-                "chain_id": int(self.chain_id),
+                "chain_id": int(stream_slice["chain_id"]),
                 "gas_price": trx["gasPrice"],
                 "gas_used": trx["gasUsed"],
                 "gas_decimals": self.WEI_DECIMALS,
@@ -233,14 +656,11 @@ class WalletTransactions(EtherscanStream):
             if len(point["to_address"]) == 0:
                 point["to_address"] = point["wallet_address"]
 
-            if point["from_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "out"
-            elif point["to_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "in"
+            point["movement"] = self.get_movement(wallet_address, point["from_address"], point["to_address"])
 
             yield point
 
-class WalletInternalTransactions(EtherscanStream):
+class WalletInternalTransactions(IncrementalEtherscanStream):
     """
     This refers to a transfer of ETH that is carried out through a smart contract as an intermediary.
     When viewing an address on Etherscan, this type of transaction will be shown under the Internal Txns tab
@@ -256,20 +676,12 @@ class WalletInternalTransactions(EtherscanStream):
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        txs = self.get_transactions(response)
-        params = self.get_params(response)
-        selected = self.wallet_info.get(params["address"], {})
-
-        for trx in txs:
-            timestamp = self.to_datetime(trx["timeStamp"])
-            if self.has_finished(params["address"], timestamp):
-                break
-
-            if not self.is_valid(params["address"], timestamp):
-                continue
+        selected = self.wallet_info.get(stream_slice["address"], {})
+        wallet_address = stream_slice["address"].lower()
 
+        for trx, timestamp in self.iter_transactions(response, stream_slice):
             point = {
-                "wallet_address": params["address"],
+                "wallet_address": stream_slice["address"],
                 "wallet_name": selected["name"],
                 "tags": selected["tags"],
                 "hash": trx["hash"],
@@ -282,7 +694,7 @@ class WalletInternalTransactions(EtherscanStream):
                 "token_name": "Ethereum",
                 "token_symbol": "ETH",
                 "token_decimal": self.WEI_DECIMALS,
-                "chain_id": int(self.chain_id),
+                "chain_id": int(stream_slice["chain_id"]),
                 "gas": trx["gas"],
                 "gas_used": trx["gasUsed"],
                 "gas_decimals": self.WEI_DECIMALS,
@@ -291,14 +703,11 @@ class WalletInternalTransactions(EtherscanStream):
             if len(point["to_address"]) == 0:
                 point["to_address"] = point["wallet_address"]
 
-            if point["from_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "out"
-            elif point["to_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "in"
+            point["movement"] = self.get_movement(wallet_address, point["from_address"], point["to_address"])
 
             yield point
 
-class WalletTokenTransactions(EtherscanStream):
+class WalletTokenTransactions(IncrementalEtherscanStream):
     """
     Transactions of ERC-20 or ERC-721 tokens are labelled as Token Transfer transactions.
     When viewing an address on Etherscan, this type of transaction will be shown under either the Erc20 Token Txns or Erc721 Token Txns tab, depending on the respective token type.
@@ -314,22 +723,14 @@ class WalletTokenTransactions(EtherscanStream):
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        txs = self.get_transactions(response)
-        params = self.get_params(response)
-        selected = self.wallet_info.get(params["address"], {})
-
-        for trx in txs:
-            timestamp = self.to_datetime(trx["timeStamp"])
-            if self.has_finished(params["address"], timestamp):
-                break
-
-            if not self.is_valid(params["address"], timestamp):
-                continue
+        selected = self.wallet_info.get(stream_slice["address"], {})
+        wallet_address = stream_slice["address"].lower()
 
+        for trx, timestamp in self.iter_transactions(response, stream_slice):
             method_call = trx["functionName"] if len(trx["functionName"]) > 0 else None
 
             point = {
-                "wallet_address": params["address"],
+                "wallet_address": stream_slice["address"],
                 "wallet_name": selected.get("name"),
                 "tags": selected.get("tags"),
                 "hash": trx["hash"],
@@ -349,71 +750,89 @@ class WalletTokenTransactions(EtherscanStream):
                 "gas_price": trx["gasPrice"],
                 "gas_used": trx["gasUsed"],
                 "gas_decimals": self.WEI_DECIMALS,
-                "chain_id": int(self.chain_id),
+                "chain_id": int(stream_slice["chain_id"]),
                 "is_error": False
             }
             if len(point["to_address"]) == 0:
                 point["to_address"] = point["wallet_address"]
 
-            if point["from_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "out"
-            elif point["to_address"].lower() == point["wallet_address"].lower():
-                point["movement"] = "in"
+            point["movement"] = self.get_movement(wallet_address, point["from_address"], point["to_address"])
 
             yield point
 
 class NativeBalance(EtherscanStream):
     """
-    Current native balance (ETH) for the wallets
+    Current native balance (ETH) for the wallets, fetched with `balancemulti` in batches of `BATCH_SIZE` wallets
 
     NOTE: Used for debugging purposes
     """
+    # Maximum number of addresses accepted by `balancemulti`
+    BATCH_SIZE = 20
 
     def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, **kwargs):
         super().__init__(api_key, wallets, chain_id, backfill, sleep_seconds, pagination_offset, **kwargs)
 
-    def next_page_token(self, response: requests.Response):
-        time.sleep(self.sleep_seconds)
-        return None
+    def chain_slices(self, chain_id: str, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+
+        for index in range(0, len(self.wallets), self.BATCH_SIZE):
+            batch = self.wallets[index:index + self.BATCH_SIZE]
+            self.logger.info(f"{self.name} > stream_slice: Fetching data for {', '.join(wallet['name'] for wallet in batch)} on chain {chain_id}")
+            yield {
+                "chain_id": chain_id,
+                "address": ",".join(wallet["address"] for wallet in batch),
+            }
 
     def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, any] = None, next_page_token: Mapping[str, Any] = None) -> MutableMapping[str, Any]:
         params = {
             **super().request_params(stream_state, stream_slice, next_page_token),
-            "action": "balance",
+            "action": "balancemulti",
         }
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        data: dict = response.json()
-        params = self.get_params(response)
-        wallet_address = params["address"]
-        wallet = self.wallet_info[wallet_address]
-        point = {
-            "timestamp": datetime.datetime.now(),
-            "wallet_address": wallet_address,
-            "wallet_name": wallet["name"],
-            "tags": wallet["tags"],
-            "token_symbol": "ETH",
-            "token_decimal": self.WEI_DECIMALS,
-            "amount": data["result"],
-            "chain_id": int(self.chain_id)
-        }
-        yield point
+        data, _ = self.get_page(response)
+        result = data.get("result")
+        if not isinstance(result, list):
+            self.logger.warning(f"{self.name} > parse_response: {data.get('message')} {result}")
+            return
+
+        timestamp = datetime.datetime.now()
+        for balance in result:
+            wallet_address = self.wallet_index.get(balance["account"].lower(), balance["account"])
+            wallet = self.wallet_info.get(wallet_address, {})
+            point = {
+                "timestamp": timestamp,
+                "wallet_address": wallet_address,
+                "wallet_name": wallet.get("name"),
+                "tags": wallet.get("tags"),
+                "token_symbol": "ETH",
+                "token_decimal": self.WEI_DECIMALS,
+                "amount": balance["balance"],
+                "chain_id": int(stream_slice["chain_id"])
+            }
+            yield point
 
 class TokenBalance(EtherscanStream):
     """
     Current ERC-20 token balance
 
+    Chains with an RPC URL are read with batched `eth_call balanceOf` requests, one slice per chain,
+    instead of one Etherscan `tokenbalance` request per wallet and token.
+
     NOTE: Used for debugging purposes
     """
 
-    def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, tokens: list[dict[str, str]], **kwargs):
+    def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, tokens: list[dict[str, str]], rpc_urls: list[dict[str, str]] = None, multicall: bool = False, **kwargs):
         super().__init__(api_key, wallets, chain_id, backfill, sleep_seconds, pagination_offset, **kwargs)
         self.tokens = tokens
+        self.rpc_readers = {
+            str(rpc["chain_id"]): BalanceOfReader(rpc["url"], multicall)
+            for rpc in rpc_urls or []
+        }
 
-    def next_page_token(self, response: requests.Response):
-        time.sleep(self.sleep_seconds)
-        return None
+    def get_chain_tokens(self, chain_id: str) -> list[dict]:
+        # Tokens without a chain id are monitored on every chain
+        return [token for token in self.tokens if str(token.get("chain_id", chain_id)) == chain_id]
 
     def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, any] = None, next_page_token: Mapping[str, Any] = None) -> MutableMapping[str, Any]:
         params = {
@@ -424,11 +843,16 @@ class TokenBalance(EtherscanStream):
         self.logger.info(f"{self.name} > request_params: {stream_slice['token_symbol']} ({stream_slice['token_address']})")
         return params
 
-    def stream_slices(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Optional[Mapping[str, Any]]]:
+    def chain_slices(self, chain_id: str, sync_mode: SyncMode, cursor_field: List[str] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+
+        tokens = self.get_chain_tokens(chain_id)
+        if chain_id in self.rpc_readers:
+            self.logger.info(f"{self.name} > stream_slice: Fetching {len(tokens)} tokens for {len(self.wallets)} wallets on chain {chain_id} from the RPC")
+            yield {"chain_id": chain_id, "rpc": True}
+            return
 
-        for current_stream_slice in super().stream_slices(sync_mode, cursor_field, stream_state):
-            for token in self.tokens:
-                time.sleep(self.sleep_seconds)
+        for current_stream_slice in super().chain_slices(chain_id, sync_mode, cursor_field, stream_state):
+            for token in tokens:
                 yield {
                     **current_stream_slice,
                     "token_symbol": token["name"],
@@ -436,10 +860,37 @@ class TokenBalance(EtherscanStream):
                     "token_decimal": token["token_decimal"]
                 }
 
+    def read_slice(self, sync_mode: SyncMode, cursor_field: List[str] = None, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None) -> Iterable[Mapping[str, Any]]:
+
+        if not stream_slice.get("rpc"):
+            yield from super().read_slice(sync_mode, cursor_field, stream_slice, stream_state)
+            return
+
+        chain_id = stream_slice["chain_id"]
+        pairs = [(wallet, token) for wallet in self.wallets for token in self.get_chain_tokens(chain_id)]
+        balances = self.rpc_readers[chain_id].balances([(token["address"], wallet["address"]) for wallet, token in pairs])
+        timestamp = datetime.datetime.now()
+        for (wallet, token), balance in zip(pairs, balances):
+            if balance is None:
+                self.logger.warning(f"{self.name} > read_slice: No balance of {token['name']} for {wallet['name']} on chain {chain_id}")
+                continue
+
+            point = {
+                "timestamp": timestamp,
+                "wallet_address": wallet["address"],
+                "wallet_name": wallet["name"],
+                "tags": wallet["tags"],
+                "amount": str(balance),
+                "token_symbol": token["name"],
+                "token_address": token["address"],
+                "token_decimal": token["token_decimal"],
+                "chain_id": int(chain_id)
+            }
+            yield point
+
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        data: dict = response.json()
-        params = self.get_params(response)
-        wallet_address = params["address"]
+        data, _ = self.get_page(response)
+        wallet_address = stream_slice["address"]
         wallet = self.wallet_info[wallet_address]
         point = {
             "timestamp": datetime.datetime.now(),
@@ -450,15 +901,18 @@ class TokenBalance(EtherscanStream):
             "token_symbol": stream_slice["token_symbol"],
             "token_address": stream_slice["token_address"],
             "token_decimal": stream_slice["token_decimal"],
-            "chain_id": int(self.chain_id)
+            "chain_id": int(stream_slice["chain_id"])
         }
         yield point
 
 
-class MinedBlocks(EtherscanStream):
+class MinedBlocks(IncrementalEtherscanStream):
     """
     Get newly minted ETH block rewards earned by the wallet
     """
+    # `getminedblocks` has no block range, new blocks are read newest first until the stored block
+    supports_block_range = False
+
     def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, **kwargs):
         super().__init__(api_key, wallets, chain_id, backfill, sleep_seconds, pagination_offset, **kwargs)
 
@@ -470,38 +924,30 @@ class MinedBlocks(EtherscanStream):
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        txs = self.get_transactions(response)
-        params = self.get_params(response)
-        selected = self.wallet_info.get(params["address"], {})
-
-        for trx in txs:
-            timestamp = self.to_datetime(trx["timeStamp"])
-            if self.has_finished(params["address"], timestamp):
-                break
-
-            if not self.is_valid(params["address"], timestamp):
-                continue
+        selected = self.wallet_info.get(stream_slice["address"], {})
+        wallet_address = stream_slice["address"].lower()
 
+        for trx, timestamp in self.iter_transactions(response, stream_slice):
             point = {
-                "wallet_address": params["address"],
+                "wallet_address": stream_slice["address"],
                 "wallet_name": selected.get("name"),
                 "tags": selected.get("tags"),
                 "block": int(trx["blockNumber"]),
                 "timestamp": timestamp,
                 "from_address": self.EMPTY_ADDRESS,
                 "movement": "in",
-                "to_address": params["address"],
+                "to_address": stream_slice["address"],
                 "amount": trx["blockReward"],
                 "token_name": "Ethereum",
                 "token_symbol": "ETH",
                 "token_decimal": self.WEI_DECIMALS,
-                "chain_id": int(self.chain_id),
+                "chain_id": int(stream_slice["chain_id"]),
                 "is_error": False
             }
 
             yield point
 
-class BeaconWithdrawals(EtherscanStream):
+class BeaconWithdrawals(IncrementalEtherscanStream):
 
     def __init__(self, api_key: str, wallets: list[dict], chain_id: str, backfill: bool, sleep_seconds: int, pagination_offset: int, **kwargs):
         super().__init__(api_key, wallets, chain_id, backfill, sleep_seconds, pagination_offset, **kwargs)
@@ -514,32 +960,24 @@ class BeaconWithdrawals(EtherscanStream):
         return params
 
     def parse_response(self, response, *, stream_state: Mapping[str, Any], stream_slice: Optional[Mapping[str, Any]] = None, next_page_token: Optional[Mapping[str, Any]] = None):
-        txs = self.get_transactions(response)
-        params = self.get_params(response)
-        selected = self.wallet_info.get(params["address"], {})
-
-        for trx in txs:
-            timestamp = self.to_datetime(trx["timestamp"])
-            if self.has_finished(params["address"], timestamp):
-                break
-
-            if not self.is_valid(params["address"], timestamp):
-                continue
+        selected = self.wallet_info.get(stream_slice["address"], {})
+        wallet_address = stream_slice["address"].lower()
 
+        for trx, timestamp in self.iter_transactions(response, stream_slice, timestamp_key="timestamp"):
             point = {
-                "wallet_address": params["address"],
+                "wallet_address": stream_slice["address"],
                 "wallet_name": selected.get("name"),
                 "tags": selected.get("tags"),
                 "block": int(trx["blockNumber"]),
                 "timestamp": timestamp,
                 "from_address": self.EMPTY_ADDRESS,
                 "movement": "in",
-                "to_address": params["address"],
+                "to_address": stream_slice["address"],
                 "amount": trx["amount"],
                 "token_name": "Ethereum",
                 "token_symbol": "ETH",
                 "token_decimal": self.GWEI_DECIMALS,
-                "chain_id": int(self.chain_id),
+                "chain_id": int(stream_slice["chain_id"]),
                 "is_error": False,
                 "withdrawal_index": trx["withdrawalIndex"],
                 "validator_index": trx["validatorIndex"],
@@ -547,35 +985,52 @@ class BeaconWithdrawals(EtherscanStream):
 
             yield point
 
-class SourceEtherscan(AbstractSource):
+class SourceEtherscan(ConcurrentSourceAdapter):
 
     url = "https://api.etherscan.io/v2/api"
+    # With `concurrent_streams`, each stream has a thread generating its slices and one reading them
+    STREAM_COUNT = 7
+
+    def __init__(self, catalog: Optional[ConfiguredAirbyteCatalog] = None, config: Optional[Mapping[str, Any]] = None, state: Any = None, **kwargs):
+        concurrent_source = ConcurrentSource.create(
+            2 * self.STREAM_COUNT,
+            self.STREAM_COUNT,
+            logging.getLogger("airbyte"),
+            self._slice_logger,
+            self.message_repository
+        )
+        super().__init__(concurrent_source, **kwargs)
+        self.catalog = catalog
+        self.state = state
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, any]:
         logger.info(f"URL: {self.url}")
         failed = []
         wallets: list[dict] = config["wallets"]
-        for wallet in wallets:
-            params = {
-                "chainid": config["chain_id"],
-                "module": "account",
-                "action": "balance",
-                "address": wallet["address"]
-            }
-            logger.info(f"Params: {params}")
-            params["apikey"] = config["api_key"]
-            response = requests.get(self.url, params=params)
-            logger.info(f"Status Code: {response.status_code}")
-            if response.status_code == 200:
-                continue
+        for chain_id in get_chain_ids(config["chain_id"]):
+            for index in range(0, len(wallets), NativeBalance.BATCH_SIZE):
+                batch = wallets[index:index + NativeBalance.BATCH_SIZE]
+                params = {
+                    "chainid": chain_id,
+                    "module": "account",
+                    "action": "balancemulti",
+                    "address": ",".join(wallet["address"] for wallet in batch)
+                }
+                logger.info(f"Params: {params}")
+                params["apikey"] = config["api_key"]
+                response = requests.get(self.url, params=params)
+                logger.info(f"Status Code: {response.status_code}")
+                if response.status_code == 200:
+                    continue
 
-            failed.append(f"Failed connection check for {wallet}")
+                failed.append(f"Failed connection check on chain {chain_id} for {[wallet['name'] for wallet in batch]}")
 
         return len(failed) == 0, "\n".join(failed) if failed else None
 
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         params = {
             **config,
+            "api_key_pool": ApiKeyPool.from_config(config),
             "wallets": [
                 {
                     "tags": wallet["tags"],
@@ -595,4 +1050,25 @@ class SourceEtherscan(AbstractSource):
             MinedBlocks(**params),
             BeaconWithdrawals(**params)
         ]
-        return streams
+        if not config.get("concurrent_streams") or self.catalog is None:
+            return streams
+
+        state_manager = ConnectorStateManager(stream_instance_map={stream.stream.name: stream.stream for stream in self.catalog.streams}, state=self.state)
+        sync_modes = {stream.stream.name: stream.sync_mode for stream in self.catalog.streams}
+        return [self.to_concurrent_stream(stream, sync_modes.get(stream.name), state_manager) for stream in streams]
+
+    def to_concurrent_stream(self, stream: EtherscanStream, sync_mode: Optional[SyncMode], state_manager: ConnectorStateManager) -> Stream:
+        """
+        Wrap the stream to be read by the concurrent source, every stream shares the API key pool budget
+        """
+        logger = logging.getLogger("airbyte")
+        stream.slice_gate = SliceGate()
+        if sync_mode == SyncMode.incremental:
+            state = state_manager.get_stream_state(stream.name, stream.namespace)
+            stream.state = state
+            cursor = StreamStateCursor(stream, self.message_repository, state_manager)
+        else:
+            state = None
+            cursor = FullRefreshCursor(stream, self.message_repository)
+
+        return StreamFacade.create_from_stream(stream, self, logger, state, cursor)
@@ -0,0 +1,40 @@
+import pytest
+from airbyte_cdk.models import FailureType
+from airbyte_cdk.utils import AirbyteTracedException
+from source_etherscan.source import WalletTransactions
+
+API_URL = "https://api.etherscan.io/v2/api"
+WALLETS = [{"address": "0xde0B295669a9FD93d5F28D9Ec85E40f4cb697BAe", "name": "wallet", "tags": []}]
+
+
+@pytest.fixture
+def stream():
+    return WalletTransactions(api_key="key", wallets=WALLETS, chain_id="1", backfill=False, sleep_seconds=0, pagination_offset=100)
+
+
+def test_latest_block_retries_until_hex(stream, requests_mock):
+    requests_mock.get(API_URL, [
+        {"json": {"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}},
+        {"json": {"jsonrpc": "2.0", "id": 83, "result": "0x10"}},
+    ])
+    assert stream.get_latest_block("1") == 16
+    # Fetched once per sync
+    assert stream.get_latest_block("1") == 16
+    assert requests_mock.call_count == 2
+
+
+def test_latest_block_gives_up_on_permanent_error(stream, requests_mock):
+    requests_mock.get(API_URL, json={"status": "0", "message": "NOTOK", "result": "Invalid API Key"})
+    with pytest.raises(AirbyteTracedException) as error:
+        stream.get_latest_block("1")
+    assert error.value.failure_type == FailureType.config_error
+    assert "Invalid API Key" in error.value.message
+    assert requests_mock.call_count == stream.max_retries + 1
+
+
+def test_latest_block_gives_up_on_non_json_body(stream, requests_mock):
+    requests_mock.get(API_URL, status_code=502, text="<html>Bad Gateway</html>")
+    with pytest.raises(AirbyteTracedException) as error:
+        stream.get_latest_block("1")
+    assert "Bad Gateway" in error.value.message
+    assert requests_mock.call_count == stream.max_retries + 1
@@ -0,0 +1,104 @@
+import pytest
+from source_etherscan.rpc import BalanceOfReader
+
+RPC_URL = "http://rpc.local"
+USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
+WALLET = "0xde0B295669a9FD93d5F28D9Ec85E40f4cb697BAe"
+DEPOSIT = "0x00000000219ab540356cBB839Cbe05303d7705Fa"
+
+
+def words(*values) -> str:
+    return "".join(value if isinstance(value, str) else f"{value:064x}" for value in values)
+
+
+# aggregate3([(USDT, true, balanceOf(WALLET)), (USDC, true, balanceOf(DEPOSIT))]), encoded with eth_abi
+AGGREGATE3_CALL = "0x82ad56cb" + words(
+    0x20, 2, 0x40, 0x100,
+    USDT.lower()[2:].rjust(64, "0"), 1, 0x60, 0x24,
+    "70a08231" + WALLET.lower()[2:].rjust(64, "0") + "0" * 56,
+    USDC.lower()[2:].rjust(64, "0"), 1, 0x60, 0x24,
+    "70a08231" + DEPOSIT.lower()[2:].rjust(64, "0") + "0" * 56,
+)
+
+# [(true, uint256(1234567)), (false, ""), (true, 0x0102), (true, "")], encoded with eth_abi
+AGGREGATE3_RESULT = "0x" + words(
+    0x20, 4, 0x80, 0x100, 0x160, 0x1e0,
+    1, 0x40, 0x20, 1234567,
+    0, 0x40, 0,
+    1, 0x40, 2, "0102" + "0" * 60,
+    1, 0x40, 0,
+)
+
+
+def test_encode_aggregate3():
+    reader = BalanceOfReader(RPC_URL, multicall=True)
+    assert reader.encode_aggregate3([(USDT, WALLET), (USDC, DEPOSIT)]) == AGGREGATE3_CALL
+
+
+def test_decode_aggregate3():
+    reader = BalanceOfReader(RPC_URL, multicall=True)
+    assert reader.decode_aggregate3(AGGREGATE3_RESULT) == [
+        (True, f"0x{1234567:064x}"),
+        (False, "0x"),
+        (True, "0x0102"),
+        (True, "0x"),
+    ]
+
+
+def test_decode_aggregate3_truncated():
+    reader = BalanceOfReader(RPC_URL, multicall=True)
+    with pytest.raises(ValueError, match="truncated"):
+        reader.decode_aggregate3(AGGREGATE3_RESULT[:-64])
+
+
+@pytest.mark.parametrize("value, expected", [
+    (f"0x{1234567:064x}", 1234567),
+    ("0x", None),
+    (None, None),
+    ("0x0102", None),
+])
+def test_decode_uint(value, expected):
+    assert BalanceOfReader(RPC_URL).decode_uint(value) == expected
+
+
+def test_multicall_balances(requests_mock):
+    requests_mock.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "result": AGGREGATE3_RESULT})
+    reader = BalanceOfReader(RPC_URL, multicall=True)
+    calls = [(USDT, WALLET), (USDC, DEPOSIT), (USDT, DEPOSIT), (USDC, WALLET)]
+    # Failed calls and short return data have no balance
+    assert reader.balances(calls) == [1234567, None, None, None]
+    assert requests_mock.last_request.json()["params"][0] == {"to": BalanceOfReader.MULTICALL3_ADDRESS, "data": reader.encode_aggregate3(calls)}
+
+
+def test_multicall_error(requests_mock):
+    requests_mock.post(RPC_URL, json={"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "execution reverted"}})
+    with pytest.raises(Exception, match="execution reverted"):
+        BalanceOfReader(RPC_URL, multicall=True).balances([(USDT, WALLET)])
+
+
+def test_batch_balances(requests_mock):
+    def respond(request, context):
+        # Responses of a batch may come in any order
+        items = [
+            {"jsonrpc": "2.0", "id": 0, "result": f"0x{10:064x}"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": -32000, "message": "execution reverted"}},
+            {"jsonrpc": "2.0", "id": 2, "result": "0x"},
+        ]
+        return items[::-1]
+
+    requests_mock.post(RPC_URL, json=respond)
+    reader = BalanceOfReader(RPC_URL)
+    assert reader.balances([(USDT, WALLET), (USDC, WALLET), (USDT, DEPOSIT)]) == [10, None, None]
+    call = requests_mock.last_request.json()[0]
+    assert call["params"][0] == {"to": USDT, "data": "0x70a08231" + WALLET.lower()[2:].rjust(64, "0")}
+
+
+@pytest.mark.parametrize("multicall, batch_size", [(False, BalanceOfReader.BATCH_SIZE), (True, BalanceOfReader.MULTICALL_BATCH_SIZE)])
+def test_balances_split_in_batches(mocker, multicall, batch_size):
+    reader = BalanceOfReader(RPC_URL, multicall=multicall)
+    read_batch = mocker.patch.object(reader, "multicall_balances" if multicall else "batch_balances", side_effect=lambda batch: list(range(len(batch))))
+    calls = [(USDT, WALLET)] * (2 * batch_size + 1)
+    balances = reader.balances(calls)
+    assert [len(call.args[0]) for call in read_batch.call_args_list] == [batch_size, batch_size, 1]
+    assert len(balances) == len(calls)
@@ -6,7 +6,8 @@
 from setuptools import find_packages, setup
 
 MAIN_REQUIREMENTS = [
-    "airbyte-cdk~=0.2",
+    # HttpStream._send_request and the per stream state messages of 0.90
+    "airbyte-cdk~=0.90.0",
 ]
 
 TEST_REQUIREMENTS = [
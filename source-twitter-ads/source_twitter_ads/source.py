@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import Any, List, Mapping, Tuple
+from typing import Any, Iterator, List, Mapping, Optional, Set, Tuple
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateType, ConfiguredAirbyteCatalog, SyncMode
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 
@@ -7,6 +8,8 @@ import requests
 from requests_oauthlib import OAuth1
 
 from .stream import (
+  DEFAULT_ATTRIBUTION_WINDOW_DAYS,
+  DEFAULT_MAX_CONCURRENT_ACCOUNTS,
   Account,
   AdvertisementCampaign,
   Campaign,
@@ -14,11 +17,20 @@ from .stream import (
   PromotedTweet,
   PromotedTweetBilling,
   PromotedTweetEngagement,
+  PromotedTweetStats,
+  RateLimiter,
 )
 
+STATS_STREAMS = ("promoted_tweet_billing", "promoted_tweet_engagement")
+
 
 class SourceTwitterFetcher(AbstractSource):
 
+  # Streams of the catalog being read, `None` outside of a read
+  selected_streams: Optional[Set[str]] = None
+  # Incremental state of the stats streams being read
+  stats_states: Mapping[str, Mapping[str, Any]] = {}
+
   def auth(self, config: Mapping[str, Any]) -> OAuth1:
     creds=config['credentials']
     return OAuth1(
@@ -33,14 +45,33 @@ class SourceTwitterFetcher(AbstractSource):
     args = {
       "account_ids": config["account_ids"],
       "authenticator": self.auth(config),
+      # One budget per endpoint shared by every stream of the sync
+      "rate_limiter": RateLimiter(),
     }
     account = Account(**args)
-    funding_instrument = FundingInstrument(parent=account, **args)
-    campaign = Campaign(parent=account, **args)
-    line_item = AdvertisementCampaign(parent=account, **args)
-    promoted_tweet = PromotedTweet(parent=account, **args)
-    promoted_tweet_billing = PromotedTweetBilling(parent=promoted_tweet, **args)
-    promoted_tweet_engagement = PromotedTweetEngagement(parent=promoted_tweet, **args)
+    account_args = {
+      **args,
+      "parent": account,
+      "max_concurrent_accounts": config.get("max_concurrent_accounts", DEFAULT_MAX_CONCURRENT_ACCOUNTS),
+    }
+    funding_instrument = FundingInstrument(**account_args)
+    campaign = Campaign(**account_args)
+    line_item = AdvertisementCampaign(**account_args)
+    promoted_tweet = PromotedTweet(**account_args)
+    # Billing and engagement share one stats request per batch, the rows are
+    # only kept for the stats streams selected in the catalog
+    consumers = [name for name in STATS_STREAMS if self.selected_streams is None or name in self.selected_streams]
+    promoted_tweet_stats = PromotedTweetStats(
+      consumers=consumers,
+      async_stats=config.get("async_stats", False),
+      start_date=config.get("start_date"),
+      attribution_window_days=config.get("attribution_window_days", DEFAULT_ATTRIBUTION_WINDOW_DAYS),
+      parent=account,
+      **args,
+    )
+    promoted_tweet_stats.consumer_states = self.stats_states
+    promoted_tweet_billing = PromotedTweetBilling(stats=promoted_tweet_stats)
+    promoted_tweet_engagement = PromotedTweetEngagement(stats=promoted_tweet_stats)
 
     return [
       account,
@@ -51,3 +82,25 @@ class SourceTwitterFetcher(AbstractSource):
       promoted_tweet_billing,
       promoted_tweet_engagement,
     ]
+
+  def read(self, logger, config, catalog: ConfiguredAirbyteCatalog, state=None) -> Iterator[AirbyteMessage]:
+    self.selected_streams = {configured_stream.stream.name for configured_stream in catalog.streams}
+    self.stats_states = self.read_stats_states(catalog, state)
+    try:
+      yield from super().read(logger, config, catalog, state)
+    finally:
+      self.selected_streams = None
+      self.stats_states = {}
+
+  @staticmethod
+  def read_stats_states(catalog: ConfiguredAirbyteCatalog, state) -> Mapping[str, Mapping[str, Any]]:
+    """State of each stats stream read incrementally, empty for the others."""
+    stream_states = {}
+    for message in state or []:
+      if message.type == AirbyteStateType.STREAM and message.stream.stream_state:
+        stream_states[message.stream.stream_descriptor.name] = message.stream.stream_state.dict()
+    return {
+      configured_stream.stream.name: stream_states.get(configured_stream.stream.name, {}) if configured_stream.sync_mode == SyncMode.incremental else {}
+      for configured_stream in catalog.streams
+      if configured_stream.stream.name in STATS_STREAMS
+    }
@@ -1,9 +1,20 @@
-from typing import Any, Iterable, Mapping, MutableMapping, Optional, List
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Mapping, MutableMapping, Optional, List, Set, Tuple
+import gzip
+import json
 import logging
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 
 logger = logging.getLogger("airbyte")
@@ -11,6 +22,24 @@ logger = logging.getLogger("airbyte")
 DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 DATE_FORMAT_DAY = "%Y-%m-%d"
 STATS_ENTITY_BATCH_SIZE = 20
+# Async stats jobs accept up to 2000 entities per job
+ASYNC_STATS_ENTITY_BATCH_SIZE = 2000
+# Seconds between two polls of a stats job, doubled up to the max
+ASYNC_STATS_POLL_INTERVAL = 5
+ASYNC_STATS_MAX_POLL_INTERVAL = 60
+ASYNC_STATS_JOB_TIMEOUT = 60 * 60
+# Days covered by one stats request or job, the API limits
+STATS_WINDOW_DAYS = 7
+ASYNC_STATS_WINDOW_DAYS = 90
+# Days before the last synced day that are read again, their stats can still change
+DEFAULT_ATTRIBUTION_WINDOW_DAYS = 3
+# Share of the calls of a rate limit window under which requests are spread
+# over the rest of the window
+LOW_RATE_LIMIT_BUDGET = 0.1
+DEFAULT_MAX_CONCURRENT_ACCOUNTS = 10
+# Bytes of stats rows kept in memory for the other consumer, the rest is
+# spooled to a temporary file
+PENDING_STATS_MEMORY_BYTES = 16 * 1024 * 1024
 
 
 def _utc_midnight() -> datetime:
@@ -19,14 +48,85 @@ def _utc_midnight() -> datetime:
   return datetime(now.year, now.month, now.day)
 
 
+class RateLimiter:
+  """Paces the requests of each endpoint from the `x-rate-limit-*` headers of
+  its last response. Twitter Ads limits are per endpoint and account, the
+  method and URL path identify both.
+
+  Requests are not delayed while the endpoint has budget left, once it runs
+  low the remaining calls are spread evenly until the window resets."""
+
+  def __init__(self, low_budget: float = LOW_RATE_LIMIT_BUDGET):
+    self.low_budget = low_budget
+    self._lock = threading.Lock()
+    # endpoint -> limit, remaining calls, reset epoch and earliest next call
+    self._windows: MutableMapping[str, MutableMapping[str, float]] = {}
+
+  @staticmethod
+  def endpoint(request: requests.PreparedRequest) -> str:
+    return f"{request.method} {urlparse(request.url).path}"
+
+  def update(self, response: requests.Response):
+    headers = response.headers
+    try:
+      remaining = int(headers["x-rate-limit-remaining"])
+      reset_at = int(headers["x-rate-limit-reset"])
+      limit = int(headers.get("x-rate-limit-limit") or remaining)
+    except (KeyError, ValueError):
+      return
+    endpoint = self.endpoint(response.request)
+    with self._lock:
+      window = self._windows.get(endpoint, {})
+      self._windows[endpoint] = {
+        "limit": limit,
+        "remaining": remaining,
+        "reset_at": reset_at,
+        "next_call": window.get("next_call", 0) if window.get("reset_at") == reset_at else 0,
+      }
+
+  def wait(self, request: requests.PreparedRequest):
+    endpoint = self.endpoint(request)
+    with self._lock:
+      window = self._windows.get(endpoint)
+      now = time.time()
+      if not window or now >= window["reset_at"]:
+        return
+      if window["remaining"] > window["limit"] * self.low_budget:
+        window["remaining"] -= 1
+        return
+      if window["remaining"] <= 0:
+        # Out of calls, the next response starts a new window
+        delay = window["reset_at"] - now + 1
+        del self._windows[endpoint]
+      else:
+        call_at = max(now, window["next_call"])
+        window["next_call"] = call_at + (window["reset_at"] - now) / window["remaining"]
+        window["remaining"] -= 1
+        delay = call_at - now
+    if delay > 0:
+      logger.info("Rate limit budget of %s is low, waiting %.1fs", endpoint, delay)
+      time.sleep(delay)
+
+
 class TwitterAdsStream(HttpStream):
   url_base = "https://ads-api.x.com/12/"
 
-  def __init__(self, account_ids: List[str] = None, **kwargs):
+  def __init__(self, account_ids: List[str] = None, rate_limiter: Optional[RateLimiter] = None, **kwargs):
     super().__init__(**kwargs)
     self.account_ids = account_ids or []
+    self.rate_limiter = rate_limiter or RateLimiter()
+    self._session.hooks["response"].append(self._update_rate_limit)
     logger.info("twitter ads account ids: %s", self.account_ids)
 
+  def _update_rate_limit(self, response: requests.Response, **kwargs) -> requests.Response:
+    if not getattr(response, "from_cache", False):
+      self.rate_limiter.update(response)
+    return response
+
+  def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+    self.rate_limiter.wait(request)
+    return super()._send_request(request, request_kwargs)
+
   @staticmethod
   def _safe_json(response: requests.Response) -> Optional[Mapping[str, Any]]:
     try:
@@ -117,7 +217,73 @@ class Account(TwitterAdsStream):
       logger.warn("No data in the account response")
 
 
-class FundingInstrument(HttpSubStream, TwitterAdsStream):
+class AccountSubStream(HttpSubStream, TwitterAdsStream):
+  """Stream of the records of each ad account. Up to `max_concurrent_accounts`
+  accounts are read at the same time, each by one thread that reads its pages
+  in order, and the slices are emitted in the order of the accounts.
+
+  Twitter Ads limits each account separately, the rate limiter keeps the
+  budget of every account and endpoint."""
+
+  def __init__(self, max_concurrent_accounts: int = DEFAULT_MAX_CONCURRENT_ACCOUNTS, **kwargs):
+    super().__init__(**kwargs)
+    self.max_concurrent_accounts = max_concurrent_accounts
+    self._session.mount("https://", HTTPAdapter(pool_maxsize=max_concurrent_accounts))
+    # account id -> records read ahead of its slice
+    self._prefetched: MutableMapping[str, List[Mapping[str, Any]]] = {}
+
+  @property
+  def availability_strategy(self):
+    # The probe reads the first slice, which would start reading the accounts
+    # ahead and throw their records away
+    return None
+
+  def stream_slices(
+    self,
+    sync_mode=None,
+    cursor_field: List[str] = None,
+    stream_state: Mapping[str, Any] = None,
+  ) -> Iterable[Optional[Mapping[str, Any]]]:
+    account_slices = super().stream_slices(sync_mode=sync_mode, cursor_field=cursor_field, stream_state=stream_state)
+    if self.max_concurrent_accounts <= 1:
+      yield from account_slices
+      return
+
+    with ThreadPoolExecutor(max_workers=self.max_concurrent_accounts, thread_name_prefix=self.name) as executor:
+      reading = deque()
+      try:
+        for account_slice in account_slices:
+          reading.append((account_slice, executor.submit(self.read_account, account_slice)))
+          if len(reading) >= self.max_concurrent_accounts:
+            yield self._prefetch(*reading.popleft())
+        while reading:
+          yield self._prefetch(*reading.popleft())
+      finally:
+        for _, future in reading:
+          future.cancel()
+
+  def _prefetch(self, account_slice: Mapping[str, Any], future) -> Mapping[str, Any]:
+    self._prefetched[account_slice["parent"]["id"]] = future.result()
+    return account_slice
+
+  def read_account(self, account_slice: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+    return list(super().read_records(sync_mode=SyncMode.full_refresh, stream_slice=account_slice))
+
+  def read_records(
+    self,
+    sync_mode: SyncMode,
+    cursor_field: List[str] = None,
+    stream_slice: Mapping[str, Any] = None,
+    stream_state: Mapping[str, Any] = None,
+  ) -> Iterable[Mapping[str, Any]]:
+    account_id = stream_slice["parent"]["id"]
+    if account_id in self._prefetched:
+      yield from self._prefetched.pop(account_id)
+    else:
+      yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+
+class FundingInstrument(AccountSubStream):
   primary_key = "id"
 
   @property
@@ -155,7 +321,7 @@ class FundingInstrument(HttpSubStream, TwitterAdsStream):
       yield instrument
 
 
-class Campaign(HttpSubStream, TwitterAdsStream):
+class Campaign(AccountSubStream):
   primary_key = "id"
 
   @property
@@ -193,7 +359,7 @@ class Campaign(HttpSubStream, TwitterAdsStream):
       yield campaign
 
 
-class AdvertisementCampaign(HttpSubStream, TwitterAdsStream):
+class AdvertisementCampaign(AccountSubStream):
   primary_key = "id"
 
   def path(
@@ -227,7 +393,7 @@ class AdvertisementCampaign(HttpSubStream, TwitterAdsStream):
       logger.warn("No data in the line_item response for %s account", account_name)
 
 
-class PromotedTweet(HttpSubStream, TwitterAdsStream):
+class PromotedTweet(AccountSubStream):
   primary_key = "id"
 
   @property
@@ -266,12 +432,11 @@ class PromotedTweet(HttpSubStream, TwitterAdsStream):
 
 
 def _batched_active_tweet_slices(
-  parent_iter: Iterable[Mapping[str, Any]],
+  tweets: Iterable[Mapping[str, Any]],
   batch_size: int = STATS_ENTITY_BATCH_SIZE,
 ) -> Iterable[Mapping[str, Any]]:
   buffers: MutableMapping[str, List[str]] = {}
-  for parent_slice in parent_iter:
-    tweet = parent_slice["parent"]
+  for tweet in tweets:
     if tweet.get("entity_status") != "ACTIVE":
       continue
     if tweet.get("paused"):
@@ -290,9 +455,46 @@ def _batched_active_tweet_slices(
       yield {"account_id": account_id, "promoted_tweet_ids": buf}
 
 
-class PromotedTweetBilling(HttpSubStream, TwitterAdsStream):
+class PromotedTweetStats(HttpSubStream, TwitterAdsStream):
+  """Shared fetcher of the promoted tweet stats, not a stream of the catalog.
+
+  `PromotedTweetBilling` and `PromotedTweetEngagement` read the same batches of
+  active promoted tweets with the same window and placement, so both metric
+  groups are requested at once. The rows of a batch are kept until every
+  consumer stream of the sync has read them. The streams are read one after
+  the other, the rows of the whole sync wait for the second consumer in a
+  temporary file that stays in memory up to `PENDING_STATS_MEMORY_BYTES`.
+
+  The batches come from an index of the promoted tweets of each account kept
+  in the state of the consumers, only the promoted tweets updated since the
+  last sync are listed.
+  """
+
   primary_key = "id"
 
+  METRIC_GROUPS = ("BILLING", "ENGAGEMENT")
+
+  def __init__(
+    self,
+    consumers: Iterable[str] = ("promoted_tweet_billing", "promoted_tweet_engagement"),
+    async_stats: bool = False,
+    start_date: Optional[str] = None,
+    attribution_window_days: int = DEFAULT_ATTRIBUTION_WINDOW_DAYS,
+    **kwargs,
+  ):
+    super().__init__(**kwargs)
+    self.consumers = set(consumers)
+    self.async_stats = async_stats
+    self.start_date = date.fromisoformat(start_date) if start_date else None
+    self.attribution_window_days = attribution_window_days
+    # slice key -> (offset and size of the rows in the spool, consumers that did not read them yet)
+    self._pending: MutableMapping[str, Tuple[int, int, Set[str]]] = {}
+    self._spool: Optional[tempfile.SpooledTemporaryFile] = None
+    # account id -> promoted tweet index listed during this sync
+    self.indexes: MutableMapping[str, Mapping[str, Any]] = {}
+    # consumer -> incremental state at the start of the sync, set by the source
+    self.consumer_states: MutableMapping[str, Mapping[str, Any]] = {}
+
   def path(
     self,
     stream_state: Mapping[str, Any] = None,
@@ -307,7 +509,114 @@ class PromotedTweetBilling(HttpSubStream, TwitterAdsStream):
     stream_state: Mapping[str, Any] = None,
     **kwargs,
   ) -> Iterable[Optional[Mapping[str, Any]]]:
-    yield from _batched_active_tweet_slices(super().stream_slices(sync_mode=sync_mode))
+    """Batches of active promoted tweets for each window of days of their
+    account, the account state `{"<account_id>": {"date": "<last synced day>"}}`
+    sets the first window."""
+    if self.async_stats:
+      batch_size, window_days = ASYNC_STATS_ENTITY_BATCH_SIZE, ASYNC_STATS_WINDOW_DAYS
+    else:
+      batch_size, window_days = STATS_ENTITY_BATCH_SIZE, STATS_WINDOW_DAYS
+
+    stream_state = stream_state or {}
+    for account_slice in super().stream_slices(sync_mode=sync_mode):
+      account_id = account_slice["parent"]["id"]
+      tweet_index = self.promoted_tweet_index(account_id, stream_state.get(account_id, {}))
+      tweets = ({**entity, "id": tweet_id, "account_id": account_id} for tweet_id, entity in tweet_index["promoted_tweets"].items())
+      account_batches = list(_batched_active_tweet_slices(tweets, batch_size))
+      if not account_batches:
+        # Nothing to request, the slice still lets the consumers save the index
+        yield {"account_id": account_id, "promoted_tweet_ids": []}
+        continue
+
+      cursor = self.shared_cursor(account_id, stream_state)
+      for start, end in self.stats_windows(cursor, window_days):
+        for batch_number, batch in enumerate(account_batches):
+          yield {
+            **batch,
+            "start_date": start.strftime(DATE_FORMAT_DAY),
+            "end_date": end.strftime(DATE_FORMAT_DAY),
+            # The account state moves to the end of the window after its last batch
+            "completes_window": batch_number == len(account_batches) - 1,
+          }
+
+  def shared_cursor(self, account_id: str, stream_state: Mapping[str, Any]) -> Optional[str]:
+    """Last day synced by every consumer for an account, so that the consumers
+    read the same windows and share their requests even when one of them is
+    behind, e.g. just added to the catalog or reset."""
+    states = [self.consumer_states.get(consumer) or {} for consumer in self.consumers] if self.consumer_states else [stream_state]
+    cursors = [state.get(account_id, {}).get("date") for state in states]
+    if not all(cursors):
+      return None
+    return min(cursors)
+
+  def promoted_tweet_index(self, account_id: str, account_state: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Promoted tweets of an account by id with their `entity_status`, `paused`
+    and `updated_at`, the index of the state updated with the promoted tweets
+    listed from the most recently updated until the last sync."""
+    if account_id in self.indexes:
+      return self.indexes[account_id]
+
+    entities = dict(account_state.get("promoted_tweets") or {})
+    updated_since = account_state.get("promoted_tweets_updated_at") if entities else None
+    updated_at = updated_since
+    params = {"count": 1000, "sort_by": "updated_at-desc", "with_deleted": "true"}
+    listed = 0
+    while True:
+      body = self._request_json("GET", f"accounts/{account_id}/promoted_tweets", params)
+      done = False
+      for tweet in body.get("data") or []:
+        tweet_updated_at = tweet.get("updated_at") or ""
+        if updated_since and tweet_updated_at < updated_since:
+          done = True
+          break
+        listed += 1
+        updated_at = max(updated_at or "", tweet_updated_at)
+        if tweet.get("deleted"):
+          entities.pop(tweet["id"], None)
+        else:
+          entities[tweet["id"]] = {
+            "entity_status": tweet.get("entity_status"),
+            "paused": tweet.get("paused"),
+            "updated_at": tweet.get("updated_at"),
+          }
+      if done or not body.get("next_cursor"):
+        break
+      params["cursor"] = body["next_cursor"]
+
+    logger.info("Listed %s updated promoted tweets of %s account, %s indexed", listed, account_id, len(entities))
+    self.indexes[account_id] = {"promoted_tweets": entities, "promoted_tweets_updated_at": updated_at}
+    return self.indexes[account_id]
+
+  def stats_windows(self, cursor: Optional[str], window_days: int) -> Iterable[Tuple[date, date]]:
+    """Windows of days to read, from the day after the cursor or the days that
+    can still change, up to yesterday. The end of a window is excluded."""
+    today = _utc_midnight().date()
+    if cursor:
+      start = min(
+        date.fromisoformat(cursor) + timedelta(days=1),
+        today - timedelta(days=self.attribution_window_days),
+      )
+    else:
+      start = self.start_date or today - timedelta(days=STATS_WINDOW_DAYS)
+    if self.start_date:
+      start = max(start, self.start_date)
+    while start < today:
+      end = min(start + timedelta(days=window_days), today)
+      yield start, end
+      start = end
+
+  def stats_params(self, stream_slice: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """Parameters of a stats request or job for a batch of promoted tweets."""
+    return {
+      "entity": "PROMOTED_TWEET",
+      "entity_ids": ",".join(stream_slice["promoted_tweet_ids"]),
+      "granularity": "DAY",
+      "placement": "ALL_ON_TWITTER",
+      "metric_groups": ",".join(self.METRIC_GROUPS),
+      # Use a bare YYYY-MM-DD here; see DATE_FORMAT_DAY note above.
+      "start_time": stream_slice["start_date"],
+      "end_time": stream_slice["end_date"],
+    }
 
   def request_params(
     self,
@@ -321,17 +630,7 @@ class PromotedTweetBilling(HttpSubStream, TwitterAdsStream):
       stream_state=stream_state,
       stream_slice=stream_slice,
     )
-    end = _utc_midnight()
-    params.update({
-      "entity": "PROMOTED_TWEET",
-      "entity_ids": ",".join(stream_slice["promoted_tweet_ids"]),
-      "granularity": "DAY",
-      "placement": "ALL_ON_TWITTER",
-      "metric_groups": "BILLING",
-      # Use a bare YYYY-MM-DD here; see DATE_FORMAT_DAY note above.
-      "start_time": (end - timedelta(days=7)).strftime(DATE_FORMAT_DAY),
-      "end_time": end.strftime(DATE_FORMAT_DAY),
-    })
+    params.update(self.stats_params(stream_slice))
     return params
 
   def parse_response(
@@ -341,37 +640,191 @@ class PromotedTweetBilling(HttpSubStream, TwitterAdsStream):
     **kwargs,
   ) -> Iterable[Mapping]:
     body = self._safe_json(response) or {}
-    if "data" not in body:
-      return
-    # The request uses the same window/placement/granularity for every slice,
-    # so we mirror them onto each row instead of leaving the columns null.
-    request_end_date = _utc_midnight().date().isoformat()
-    for record in body["data"]:
+    yield from self.parse_stats(body, stream_slice["account_id"])
+
+  @staticmethod
+  def parse_stats(body: Mapping[str, Any], account_id: str) -> Iterable[Mapping[str, Any]]:
+    """Rows of a stats response or of the results of a stats job, one per
+    entity and data point."""
+    for record in body.get("data") or []:
       # When entity_ids is comma-separated, Twitter returns one record per id
       # in `data[]`; the entity is on `record["id"]`, not on the slice.
       entity_id = record.get("id")
       for data_point in record.get("id_data", []):
-        metrics = data_point.get("metrics") or {}
         yield {
           "id": entity_id,
-          "account_id": stream_slice["account_id"],
-          "activity_start_time": None,
-          "activity_end_time": None,
-          "billed_engagements": metrics.get("billed_engagements") or [],
-          "billed_charge_local_micro": metrics.get("billed_charge_local_micro") or [],
+          "account_id": account_id,
+          "metrics": data_point.get("metrics") or {},
+        }
+
+  def read_records(
+    self,
+    sync_mode: SyncMode,
+    cursor_field: List[str] = None,
+    stream_slice: Mapping[str, Any] = None,
+    stream_state: Mapping[str, Any] = None,
+  ) -> Iterable[Mapping[str, Any]]:
+    if self.async_stats:
+      yield from self.read_stats_job(stream_slice)
+    else:
+      yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+  def read_stats_job(self, stream_slice: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
+    """Rows of a batch from an async stats job: submit the job, poll it until
+    its results are ready and download them."""
+    account_id = stream_slice["account_id"]
+    job = self._request_json("POST", f"stats/jobs/accounts/{account_id}", self.stats_params(stream_slice))
+    job_id = job["data"].get("id_str") or str(job["data"]["id"])
+    logger.info("Submitted stats job %s for %s promoted tweets of %s account", job_id, len(stream_slice["promoted_tweet_ids"]), account_id)
+
+    url = self.wait_for_stats_job(account_id, job_id)
+    response = self._send_request(requests.Request("GET", url).prepare(), {})
+    content = response.content
+    # The results are a gzipped JSON file, unless the client already decoded it
+    if content[:2] == b"\x1f\x8b":
+      content = gzip.decompress(content)
+    yield from self.parse_stats(json.loads(content), account_id)
+
+  def wait_for_stats_job(self, account_id: str, job_id: str) -> str:
+    """Poll a stats job with an increasing interval, the URL of its results."""
+    interval = ASYNC_STATS_POLL_INTERVAL
+    deadline = time.time() + ASYNC_STATS_JOB_TIMEOUT
+    while True:
+      body = self._request_json("GET", f"stats/jobs/accounts/{account_id}", {"job_ids": job_id})
+      jobs = body.get("data") or []
+      status = jobs[0].get("status") if jobs else None
+      if status == "SUCCESS" and jobs[0].get("url"):
+        return jobs[0]["url"]
+      if status not in (None, "QUEUED", "PROCESSING", "SUCCESS"):
+        raise RuntimeError(f"Stats job {job_id} of {account_id} account ended with status {status}")
+      if time.time() + interval > deadline:
+        raise RuntimeError(f"Stats job {job_id} of {account_id} account did not finish in {ASYNC_STATS_JOB_TIMEOUT}s")
+      time.sleep(interval)
+      interval = min(interval * 2, ASYNC_STATS_MAX_POLL_INTERVAL)
+
+  def _request_json(self, method: str, path: str, params: Mapping[str, Any]) -> Mapping[str, Any]:
+    request = self._session.prepare_request(requests.Request(method, self._join_url(self.url_base, path), params=params))
+    return self._safe_json(self._send_request(request, {})) or {}
+
+  def read_stats(self, consumer: str, stream_slice: Mapping[str, Any]) -> Iterable[Mapping[str, Any]]:
+    """Rows of a batch for a consumer stream, requested by the first consumer
+    and replayed to the others."""
+    if not stream_slice["promoted_tweet_ids"]:
+      return
+    key = json.dumps(stream_slice, sort_keys=True)
+    if key in self._pending:
+      offset, size, waiting = self._pending[key]
+      self._spool.seek(offset)
+      rows = json.loads(self._spool.read(size))
+      waiting.discard(consumer)
+      if not waiting:
+        del self._pending[key]
+      if not self._pending:
+        # Every row was replayed, free the memory or the file
+        self._spool.close()
+        self._spool = None
+      yield from rows
+      return
+
+    rows = list(self.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+    waiting = self.consumers - {consumer}
+    if waiting:
+      if self._spool is None:
+        self._spool = tempfile.SpooledTemporaryFile(max_size=PENDING_STATS_MEMORY_BYTES)
+      data = json.dumps(rows).encode()
+      self._spool.seek(0, 2)
+      offset = self._spool.tell()
+      self._spool.write(data)
+      self._pending[key] = (offset, len(data), waiting)
+    yield from rows
+
+
+class PromotedTweetStatsStream(Stream, ABC):
+  """Rows of `PromotedTweetStats` mapped to the record shape of a metric group,
+  one record per promoted tweet and day."""
+
+  primary_key = ["id", "date"]
+  cursor_field = "date"
+
+  def __init__(self, stats: PromotedTweetStats):
+    super().__init__()
+    self.stats = stats
+    self._state: MutableMapping[str, Any] = {}
+
+  @property
+  def state(self) -> MutableMapping[str, Any]:
+    for account_id, index in self.stats.indexes.items():
+      self._state.setdefault(account_id, {}).update(index)
+    return self._state
+
+  @state.setter
+  def state(self, value: MutableMapping[str, Any]):
+    self._state = dict(value or {})
+
+  def stream_slices(
+    self,
+    sync_mode=None,
+    stream_state: Mapping[str, Any] = None,
+    **kwargs,
+  ) -> Iterable[Optional[Mapping[str, Any]]]:
+    # Both stats streams share a request when they are at the same date
+    if sync_mode != SyncMode.incremental:
+      stream_state = {}
+    yield from self.stats.stream_slices(sync_mode=sync_mode, stream_state=stream_state)
+
+  def read_records(
+    self,
+    sync_mode: SyncMode,
+    cursor_field: List[str] = None,
+    stream_slice: Mapping[str, Any] = None,
+    stream_state: Mapping[str, Any] = None,
+  ) -> Iterable[Mapping[str, Any]]:
+    # The metrics of a row are arrays with one value per day of the window,
+    # each day becomes a record with the value of that day.
+    if not stream_slice.get("start_date"):
+      return
+    start = date.fromisoformat(stream_slice["start_date"])
+    days = [start + timedelta(days=i) for i in range((date.fromisoformat(stream_slice["end_date"]) - start).days)]
+    for row in self.stats.read_stats(self.name, stream_slice):
+      for index, day in enumerate(days):
+        record = {
+          "id": row["id"],
+          "account_id": row["account_id"],
+          "activity_start_time": day.strftime(DATE_FORMAT),
+          "activity_end_time": (day + timedelta(days=1)).strftime(DATE_FORMAT),
           "placement": "ALL_ON_TWITTER",
           "granularity": "DAY",
-          "date": request_end_date,
+          "date": day.isoformat(),
         }
-    time.sleep(1)
+        day_metrics = {name: (values or [])[index:index + 1] for name, values in row["metrics"].items()}
+        record.update(self.metrics(day_metrics))
+        yield record
+
+    if stream_slice.get("completes_window"):
+      account_id = stream_slice["account_id"]
+      last_day = days[-1].isoformat()
+      synced = self._state.get(account_id, {}).get(self.cursor_field)
+      if not synced or synced < last_day:
+        self._state.setdefault(account_id, {})[self.cursor_field] = last_day
+
+  @abstractmethod
+  def metrics(self, metrics: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Metrics of the group from the metrics of a row."""
 
 
-class PromotedTweetEngagement(HttpSubStream, TwitterAdsStream):
+class PromotedTweetBilling(PromotedTweetStatsStream):
+
+  def metrics(self, metrics: Mapping[str, Any]) -> Mapping[str, Any]:
+    return {
+      "billed_engagements": metrics.get("billed_engagements") or [],
+      "billed_charge_local_micro": metrics.get("billed_charge_local_micro") or [],
+    }
+
+
+class PromotedTweetEngagement(PromotedTweetStatsStream):
   """Daily engagement metrics per promoted tweet from /stats with granularity=DAY.
   """
 
-  primary_key = "id"
-
   ENGAGEMENT_METRICS = (
     "impressions",
     "likes",
@@ -388,71 +841,5 @@ class PromotedTweetEngagement(HttpSubStream, TwitterAdsStream):
     "carousel_swipes",
   )
 
-  def path(
-    self,
-    stream_state: Mapping[str, Any] = None,
-    stream_slice: Mapping[str, Any] = None,
-    next_page_token: Mapping[str, Any] = None,
-  ) -> str:
-    return f"stats/accounts/{stream_slice['account_id']}"
-
-  def stream_slices(
-    self,
-    sync_mode=None,
-    stream_state: Mapping[str, Any] = None,
-    **kwargs,
-  ) -> Iterable[Optional[Mapping[str, Any]]]:
-    yield from _batched_active_tweet_slices(super().stream_slices(sync_mode=sync_mode))
-
-  def request_params(
-    self,
-    next_page_token: Optional[Mapping[str, Any]] = None,
-    stream_state: Mapping[str, Any] = None,
-    stream_slice: Mapping[str, Any] = None,
-  ) -> MutableMapping[str, Any]:
-    params = TwitterAdsStream.request_params(
-      self,
-      next_page_token=next_page_token,
-      stream_state=stream_state,
-      stream_slice=stream_slice,
-    )
-    end = _utc_midnight()
-    params.update({
-      "entity": "PROMOTED_TWEET",
-      "entity_ids": ",".join(stream_slice["promoted_tweet_ids"]),
-      "granularity": "DAY",
-      "placement": "ALL_ON_TWITTER",
-      "metric_groups": "ENGAGEMENT",
-      # Use a bare YYYY-MM-DD here; see DATE_FORMAT_DAY note above.
-      "start_time": (end - timedelta(days=7)).strftime(DATE_FORMAT_DAY),
-      "end_time": end.strftime(DATE_FORMAT_DAY),
-    })
-    return params
-
-  def parse_response(
-    self,
-    response: requests.Response,
-    stream_slice: Mapping[str, Any] = None,
-    **kwargs,
-  ) -> Iterable[Mapping]:
-    body = self._safe_json(response) or {}
-    if "data" not in body:
-      return
-    request_end_date = _utc_midnight().date().isoformat()
-    for record in body["data"]:
-      entity_id = record.get("id")
-      for data_point in record.get("id_data", []):
-        metrics = data_point.get("metrics") or {}
-        row = {
-          "id": entity_id,
-          "account_id": stream_slice["account_id"],
-          "activity_start_time": None,
-          "activity_end_time": None,
-          "placement": "ALL_ON_TWITTER",
-          "granularity": "DAY",
-          "date": request_end_date,
-        }
-        for metric in self.ENGAGEMENT_METRICS:
-          row[metric] = metrics.get(metric) or []
-        yield row
-    time.sleep(2)
+  def metrics(self, metrics: Mapping[str, Any]) -> Mapping[str, Any]:
+    return {metric: metrics.get(metric) or [] for metric in self.ENGAGEMENT_METRICS}
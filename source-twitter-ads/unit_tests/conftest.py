@@ -0,0 +1,59 @@
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+API_URL = "https://ads-api.x.com/12/"
+
+
+@pytest.fixture(autouse=True)
+def request_cache(tmp_path, monkeypatch):
+  """A cache per test, the in-memory cache of `use_cache` streams is shared by the process."""
+  monkeypatch.setenv("REQUEST_CACHE_PATH", str(tmp_path))
+
+
+@pytest.fixture
+def config():
+  return {
+    "account_ids": ["acc1", "acc2"],
+    "credentials": {
+      "consumer_key": "consumer_key",
+      "consumer_secret": "consumer_secret",
+      "access_key": "access_key",
+      "access_secret": "access_secret",
+    },
+  }
+
+
+def query(request):
+  return {key: values[0] for key, values in parse_qs(urlparse(request.url).query).items()}
+
+
+@pytest.fixture
+def ads_api(requests_mock):
+  """Twitter Ads API with two accounts of 30 active promoted tweets, each
+  entity of a stats request gets one row."""
+  accounts = ["acc1", "acc2"]
+
+  def promoted_tweets(request, context):
+    account_id = request.path.split("/")[3]
+    return {"data": [
+      {"id": f"{account_id}-pt{i}", "entity_status": "ACTIVE", "paused": False, "updated_at": "2025-01-01T00:00:00Z"}
+      for i in range(30)
+    ]}
+
+  def stats(request, context):
+    params = query(request)
+    return {"data": [
+      {"id": entity_id, "id_data": [{"metrics": {"billed_engagements": [1] * 7, "impressions": [10] * 7}}]}
+      for entity_id in params["entity_ids"].split(",")
+    ]}
+
+  requests_mock.get(f"{API_URL}accounts", json={"data": [{"id": account_id, "name": account_id} for account_id in accounts]})
+  requests_mock.get(re.compile(rf"{API_URL}accounts/\w+/promoted_tweets"), json=promoted_tweets)
+  requests_mock.get(re.compile(rf"{API_URL}stats/accounts/\w+(\?|$)"), json=stats)
+  return requests_mock
+
+
+def requests_to(requests_mock, path_pattern):
+  return [request for request in requests_mock.request_history if re.search(path_pattern, request.path)]
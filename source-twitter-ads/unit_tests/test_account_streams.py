@@ -0,0 +1,54 @@
+import logging
+import re
+
+import pytest
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, Type
+from source_twitter_ads.source import SourceTwitterFetcher
+
+from .conftest import API_URL, query, requests_to
+
+ACCOUNT_STREAMS = {
+  "funding_instrument": "funding_instruments",
+  "campaign": "campaigns",
+  "advertisement_campaign": "line_items",
+  "promoted_tweet": "promoted_tweets",
+}
+
+
+def catalog(*names):
+  return ConfiguredAirbyteCatalog.parse_obj({"streams": [
+    {
+      "stream": {"name": name, "json_schema": {}, "supported_sync_modes": ["full_refresh"]},
+      "sync_mode": "full_refresh",
+      "destination_sync_mode": "overwrite",
+    }
+    for name in names
+  ]})
+
+
+@pytest.fixture
+def paged_api(requests_mock):
+  """Two pages of records for every account and endpoint."""
+  def page(request, context):
+    account_id, endpoint = request.path.split("/")[3:5]
+    if query(request).get("cursor"):
+      return {"data": [{"id": f"{account_id}-{endpoint}-2"}]}
+    return {"data": [{"id": f"{account_id}-{endpoint}-1"}], "next_cursor": "2"}
+
+  requests_mock.get(f"{API_URL}accounts", json={"data": [{"id": "acc1", "name": "acc1"}, {"id": "acc2", "name": "acc2"}]})
+  requests_mock.get(re.compile(rf"{API_URL}accounts/\w+/\w+"), json=page)
+  return requests_mock
+
+
+@pytest.mark.parametrize("max_concurrent_accounts", [1, 10])
+@pytest.mark.parametrize("name, endpoint", ACCOUNT_STREAMS.items())
+def test_each_account_listed_once(config, paged_api, name, endpoint, max_concurrent_accounts):
+  config = {**config, "max_concurrent_accounts": max_concurrent_accounts}
+  messages = list(SourceTwitterFetcher().read(logging.getLogger("airbyte"), config, catalog(name)))
+
+  records = [message.record.data["id"] for message in messages if message.type == Type.RECORD]
+  assert records == [f"{account_id}-{endpoint}-{page}" for account_id in ("acc1", "acc2") for page in (1, 2)]
+  for account_id in ("acc1", "acc2"):
+    # One request per page, the availability check does not read the account ahead
+    assert len(requests_to(paged_api, rf"/accounts/{account_id}/{endpoint}")) == 2
+  assert len(requests_to(paged_api, r"/accounts$")) == 1
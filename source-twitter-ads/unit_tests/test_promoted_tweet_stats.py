@@ -0,0 +1,50 @@
+from airbyte_cdk.models import SyncMode
+from source_twitter_ads import stream as stream_module
+from source_twitter_ads.source import SourceTwitterFetcher
+
+from .conftest import requests_to
+
+
+def read_stream(stream):
+  records = []
+  for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh):
+    records += list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+  return records
+
+
+def stats_streams(config):
+  streams = {stream.name: stream for stream in SourceTwitterFetcher().streams(config)}
+  return streams["promoted_tweet_billing"], streams["promoted_tweet_engagement"]
+
+
+def test_stats_requested_once_for_both_streams(config, ads_api, mocker):
+  # Spool every batch to disk
+  mocker.patch.object(stream_module, "PENDING_STATS_MEMORY_BYTES", 1)
+  billing, engagement = stats_streams(config)
+
+  billing_records = read_stream(billing)
+  stats_requests = len(requests_to(ads_api, r"/stats/accounts/"))
+  # 2 accounts of 2 batches of 20 promoted tweets
+  assert stats_requests == 4
+  assert billing.stats._spool._rolled
+  assert all(set(request.qs["metric_groups"][0].split(",")) == {"billing", "engagement"} for request in requests_to(ads_api, r"/stats/accounts/"))
+
+  engagement_records = read_stream(engagement)
+  assert len(requests_to(ads_api, r"/stats/accounts/")) == stats_requests
+  assert len(engagement_records) == len(billing_records) == 2 * 30 * 7
+  assert engagement_records[0]["impressions"] == [10]
+  assert billing_records[0]["billed_engagements"] == [1]
+  # Every row was replayed, nothing is left in memory or on disk
+  assert billing.stats._pending == {}
+  assert billing.stats._spool is None
+
+
+def test_single_consumer_keeps_no_rows(config, ads_api):
+  source = SourceTwitterFetcher()
+  source.selected_streams = {"promoted_tweet_engagement"}
+  streams = {stream.name: stream for stream in source.streams(config)}
+  engagement = streams["promoted_tweet_engagement"]
+
+  assert len(read_stream(engagement)) == 2 * 30 * 7
+  assert engagement.stats._pending == {}
+  assert engagement.stats._spool is None
@@ -0,0 +1,75 @@
+import pytest
+import requests
+from source_twitter_ads.stream import RateLimiter
+
+URL = "https://ads-api.x.com/12/accounts/acc1/campaigns"
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def sleeps(mocker):
+  """`time.sleep` moves a virtual clock forward."""
+  clock = {"now": NOW}
+  mocker.patch("source_twitter_ads.stream.time.time", side_effect=lambda: clock["now"])
+  return mocker.patch("source_twitter_ads.stream.time.sleep", side_effect=lambda seconds: clock.update(now=clock["now"] + seconds))
+
+
+def request(url: str = URL) -> requests.PreparedRequest:
+  return requests.Request("GET", url, params={"count": 1000}).prepare()
+
+
+def response(remaining: int, reset_at: int, limit: int = 100, url: str = URL) -> requests.Response:
+  response = requests.Response()
+  response.status_code = 200
+  response.request = request(url)
+  response.headers.update({
+    "x-rate-limit-limit": str(limit),
+    "x-rate-limit-remaining": str(remaining),
+    "x-rate-limit-reset": str(reset_at),
+  })
+  return response
+
+
+def test_no_wait_while_budget_left(sleeps):
+  limiter = RateLimiter()
+  limiter.update(response(remaining=50, reset_at=NOW + 600))
+  for _ in range(40):
+    limiter.wait(request())
+  sleeps.assert_not_called()
+
+
+def test_no_wait_without_headers(sleeps):
+  limiter = RateLimiter()
+  limiter.update(requests.Response())
+  limiter.wait(request())
+  sleeps.assert_not_called()
+
+
+def test_wait_until_reset_when_out_of_calls(sleeps):
+  limiter = RateLimiter()
+  limiter.update(response(remaining=0, reset_at=NOW + 30))
+  limiter.wait(request())
+  # Until the reset, with a second of slack
+  sleeps.assert_called_once_with(31)
+
+  # Other endpoints and accounts keep their own budget
+  sleeps.reset_mock()
+  limiter.wait(request("https://ads-api.x.com/12/accounts/acc2/campaigns"))
+  sleeps.assert_not_called()
+
+
+def test_no_wait_after_reset(sleeps):
+  limiter = RateLimiter()
+  limiter.update(response(remaining=0, reset_at=NOW - 1))
+  limiter.wait(request())
+  sleeps.assert_not_called()
+
+
+def test_low_budget_spread_until_reset(sleeps):
+  limiter = RateLimiter()
+  # 4 calls left of 100, the window resets in 60 seconds
+  limiter.update(response(remaining=4, reset_at=NOW + 60))
+  for _ in range(4):
+    limiter.wait(request())
+  # The calls left are spread over the rest of the window, at 0, 15, 35 and 57.5 seconds
+  assert [call.args[0] for call in sleeps.call_args_list] == [15, 20, 22.5]
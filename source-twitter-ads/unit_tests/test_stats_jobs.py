@@ -0,0 +1,101 @@
+import gzip
+import json
+import re
+
+import pytest
+from airbyte_cdk.models import SyncMode
+from source_twitter_ads.source import SourceTwitterFetcher
+
+from .conftest import API_URL
+
+JOBS_URL = re.compile(rf"{API_URL}stats/jobs/accounts/acc1")
+RESULTS_URL = "https://ton.example/stats/jobs/1.json.gz"
+STATS_SLICE = {
+  "account_id": "acc1",
+  "promoted_tweet_ids": ["pt1", "pt2"],
+  "start_date": "2025-03-01",
+  "end_date": "2025-03-08",
+  "completes_window": True,
+}
+RESULTS = {"data": [
+  {"id": "pt1", "id_data": [{"metrics": {"impressions": [1] * 7}}]},
+  {"id": "pt2", "id_data": [{"metrics": {"impressions": [2] * 7}}]},
+]}
+
+
+@pytest.fixture
+def clock(mocker):
+  """Virtual time, `time.sleep` moves it forward and records the delays."""
+  clock = {"now": 1_700_000_000.0, "sleeps": []}
+
+  def sleep(seconds):
+    clock["sleeps"].append(seconds)
+    clock["now"] += seconds
+
+  mocker.patch("source_twitter_ads.stream.time.time", side_effect=lambda: clock["now"])
+  mocker.patch("source_twitter_ads.stream.time.sleep", side_effect=sleep)
+  return clock
+
+
+@pytest.fixture
+def stats(config):
+  streams = {stream.name: stream for stream in SourceTwitterFetcher().streams({**config, "async_stats": True})}
+  return streams["promoted_tweet_billing"].stats
+
+
+def job_statuses(*statuses):
+  return [
+    {"json": {"data": [{"id_str": "1", "status": status, "url": RESULTS_URL if status == "SUCCESS" else None}]}}
+    for status in statuses
+  ]
+
+
+def read_job(stats):
+  return list(stats.read_records(sync_mode=SyncMode.full_refresh, stream_slice=STATS_SLICE))
+
+
+def test_job_polled_until_success(stats, clock, requests_mock):
+  requests_mock.post(JOBS_URL, json={"data": {"id": 1, "id_str": "1", "status": "QUEUED"}})
+  requests_mock.get(JOBS_URL, job_statuses("QUEUED", "PROCESSING", "PROCESSING", "PROCESSING", "SUCCESS"))
+  requests_mock.get(RESULTS_URL, content=gzip.compress(json.dumps(RESULTS).encode()))
+
+  rows = read_job(stats)
+
+  submit = requests_mock.request_history[0]
+  assert submit.method == "POST"
+  assert submit.qs["entity_ids"] == ["pt1,pt2"]
+  assert submit.qs["metric_groups"] == ["billing,engagement"]
+  # The poll interval doubles from 5 seconds
+  assert clock["sleeps"] == [5, 10, 20, 40]
+  assert [row["id"] for row in rows] == ["pt1", "pt2"]
+  assert rows[1] == {"id": "pt2", "account_id": "acc1", "metrics": {"impressions": [2] * 7}}
+
+
+def test_job_results_already_decoded(stats, clock, requests_mock):
+  requests_mock.post(JOBS_URL, json={"data": {"id": 1, "status": "QUEUED"}})
+  requests_mock.get(JOBS_URL, job_statuses("SUCCESS"))
+  requests_mock.get(RESULTS_URL, json=RESULTS)
+
+  assert len(read_job(stats)) == 2
+  assert clock["sleeps"] == []
+
+
+def test_failed_job(stats, clock, requests_mock):
+  requests_mock.post(JOBS_URL, json={"data": {"id": 1, "id_str": "1", "status": "QUEUED"}})
+  requests_mock.get(JOBS_URL, job_statuses("PROCESSING", "FAILED"))
+
+  with pytest.raises(RuntimeError, match="ended with status FAILED"):
+    read_job(stats)
+  assert not requests_mock.request_history[-1].url.startswith(RESULTS_URL)
+
+
+def test_job_timeout(stats, clock, requests_mock):
+  requests_mock.post(JOBS_URL, json={"data": {"id": 1, "id_str": "1", "status": "QUEUED"}})
+  requests_mock.get(JOBS_URL, job_statuses("PROCESSING"))
+
+  with pytest.raises(RuntimeError, match="did not finish in 3600s"):
+    read_job(stats)
+  # Polled every minute once the interval is capped, never past the timeout
+  assert max(clock["sleeps"]) == 60
+  assert sum(clock["sleeps"]) <= 3600
+  assert sum(clock["sleeps"]) > 3600 - 60
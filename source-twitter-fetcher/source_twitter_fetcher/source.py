@@ -5,7 +5,7 @@ from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 
 from .tweets_stream import Account, AccountsAdditional, Tweet, TweetMetrics
-from .tweets_comments_stream import TweetComments
+from .tweets_comments_stream import TweetComments, DEFAULT_QUERY_MAX_LENGTH
 from .spaces_stream import Space, GetSpaceIds
 from .tags_stream import Tags
 from .auth import TwitterOAuth, TwitterBearerTokenAuth
@@ -60,7 +60,7 @@ class SourceTwitterFetcher(AbstractSource):
             Account(authenticator=auth, account_ids=config["account_ids"]),
             tweet,
             TweetMetrics(**default_args),
-            TweetComments(**default_args)
+            TweetComments(query_max_length=config.get("search_query_max_length", DEFAULT_QUERY_MAX_LENGTH), **default_args)
         ]
         additionals_accounts = config["account_ids"]
         if len(additionals_accounts) > 0:
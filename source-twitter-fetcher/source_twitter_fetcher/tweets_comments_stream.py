@@ -10,13 +10,18 @@ import os
 
 logger = logging.getLogger("airbyte")
 
+# Maximum length of a search query, 1024 with the Pro and Enterprise access
+DEFAULT_QUERY_MAX_LENGTH = 512
+
 class TweetComments(HttpSubStream, Tweet):
     primary_key = "id"
     cursor_field = "created_at"
 
-    def __init__(self, start_time: Union[str, datetime, None] = None, comment_days_limit: int = 2, filtered_author_ids: List[str] = None, **kwargs):
+    def __init__(self, start_time: Union[str, datetime, None] = None, comment_days_limit: int = 2, filtered_author_ids: List[str] = None,
+                 query_max_length: int = DEFAULT_QUERY_MAX_LENGTH, **kwargs):
         super().__init__(start_time=start_time, **kwargs)
         self.comment_days_limit = comment_days_limit
+        self.query_max_length = query_max_length
         self.limit_date = datetime.now() - timedelta(days=self.comment_days_limit)
         # Use provided filtered_author_ids or default to empty list
         self.filtered_author_ids = filtered_author_ids or []
@@ -59,7 +64,8 @@ class TweetComments(HttpSubStream, Tweet):
         stream_slice: Mapping[str, Any] = None
     ) -> MutableMapping[str, Any]:
         params = {
-            "query": f"conversation_id:{stream_slice['tweet_id']}",
+            "query": self.conversations_query(stream_slice["conversation_ids"]),
+            "max_results": 100,
             "tweet.fields": "author_id,created_at,conversation_id,in_reply_to_user_id,referenced_tweets,source,text,public_metrics,entities,context_annotations",
             "user.fields": "created_at,description,id,name,username",
             "expansions": "author_id,referenced_tweets.id",
@@ -74,10 +80,24 @@ class TweetComments(HttpSubStream, Tweet):
         cursor_field: Optional[List[str]] = None,
         stream_state: Mapping[str, Any] = None
     ) -> Iterable[Optional[Mapping[str, Any]]]:
-        # Get tweet IDs from the parent Tweet stream
+        """
+        Parent tweets packed by conversation into queries of up to `query_max_length` characters,
+        each slice maps the conversation ids of its query to their account
+        """
+        conversation_ids = {}
         for parent_slice in super().stream_slices(sync_mode=sync_mode):
             tweet = parent_slice["parent"]
-            yield {"tweet_id": tweet.get("id"), "account_id": tweet.get("author_id")}
+            packed = {**conversation_ids, tweet.get("id"): tweet.get("author_id")}
+            if conversation_ids and len(self.conversations_query(packed)) > self.query_max_length:
+                yield {"conversation_ids": conversation_ids}
+                packed = {tweet.get("id"): tweet.get("author_id")}
+            conversation_ids = packed
+        if conversation_ids:
+            yield {"conversation_ids": conversation_ids}
+
+    @staticmethod
+    def conversations_query(conversation_ids: Mapping[str, Any]) -> str:
+        return " OR ".join(f"conversation_id:{tweet_id}" for tweet_id in conversation_ids)
 
     def parse_response(
         self,
@@ -94,8 +114,8 @@ class TweetComments(HttpSubStream, Tweet):
                     # Check if the tweet is within the time limit
                     tweet_date = datetime.strptime(tweet.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ")
                     if tweet_date >= self.limit_date:
-                        # Add account_id to the tweet data
-                        tweet["account_id"] = stream_slice.get("account_id")
+                        # Add the account of the parent tweet, the conversation matched by the query
+                        tweet["account_id"] = stream_slice["conversation_ids"].get(tweet.get("conversation_id"))
                         yield tweet
         # Add rate limiting delay like other Twitter streams
         time.sleep(2)
@@ -9,6 +9,9 @@ from airbyte_cdk.models import SyncMode
 
 logger = logging.getLogger("airbyte")
 
+# Maximum number of ids of a `tweets?ids=` lookup
+TWEET_LOOKUP_BATCH_SIZE = 100
+
 class TwitterStream(HttpStream):
     url_base = "https://api.x.com/2/"
 
@@ -198,8 +201,13 @@ class Tweet(TwitterStream):
                 yield t
         self._apply_rate_limiting()
 
-class TweetMetrics(HttpSubStream, Tweet):
+class TweetLookup(HttpSubStream, Tweet):
+    """
+    Tweets of the parent younger than 31 days, looked up by batches of up to
+    100 ids with the `tweets?ids=` endpoint, one record per tweet
+    """
     primary_key = "id"
+    tweet_fields = ""
 
     def __init__(self, start_time: Union[str, datetime, None] = None, **kwargs):
         super().__init__(start_time=start_time, **kwargs)
@@ -210,19 +218,25 @@ class TweetMetrics(HttpSubStream, Tweet):
         stream_slice: Mapping[str, Any] = None,
         next_page_token: Mapping[str, Any] = None
     ) -> str:
-        tweet_id = stream_slice.get("id")
-        account_id = stream_slice.get("author_id")
-        logger.debug("Fetching tweet %s from Account id %s", tweet_id, account_id)
-        return f"tweets/{tweet_id}"
+        logger.debug("Fetching %s tweets from Account id %s", len(stream_slice["ids"]), stream_slice.get("author_id"))
+        return "tweets"
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         limit_date = datetime.today() - timedelta(31)
+        batch = {"author_id": None, "ids": []}
         for parent_slice in super().stream_slices(sync_mode=SyncMode.full_refresh):
             tweet = parent_slice["parent"]
-            if datetime.strptime(tweet.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ") > limit_date:
-                yield {"id": tweet.get('id'), "author_id": tweet.get("author_id")}
-            else:
-                logger.info("Not calling full metrics endpoint for tweet %s, tweet too old", tweet.get('id'))
+            if datetime.strptime(tweet.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ") <= limit_date:
+                logger.info("Not calling %s endpoint for tweet %s, tweet too old", self.name, tweet.get('id'))
+                continue
+            # A batch only holds the tweets of one account
+            if batch["ids"] and (batch["author_id"] != tweet.get("author_id") or len(batch["ids"]) >= TWEET_LOOKUP_BATCH_SIZE):
+                yield batch
+                batch = {"author_id": None, "ids": []}
+            batch["author_id"] = tweet.get("author_id")
+            batch["ids"].append(tweet.get('id'))
+        if batch["ids"]:
+            yield batch
 
     def request_params(
         self,
@@ -231,59 +245,23 @@ class TweetMetrics(HttpSubStream, Tweet):
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> MutableMapping[str, Any]:
         params = {
-            "tweet.fields": "non_public_metrics,organic_metrics,created_at",
+            "ids": ",".join(stream_slice["ids"]),
+            "tweet.fields": self.tweet_fields,
         }
         logger.debug(f"DBG-FULL - query params: %s", params)
         return params
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        if 'data' in response.json():
-            data = response.json()['data']
+        body = response.json()
+        for data in body.get('data', []):
             logger.debug("DBG-FULL-T: id %s", data.get('id'))
             yield data
+        for error in body.get('errors', []):
+            logger.info("No %s for tweet %s: %s", self.name, error.get('resource_id') or error.get('value'), error.get('detail'))
         self._apply_rate_limiting()
 
-class TweetPromoted(HttpSubStream, Tweet):
-    primary_key = "id"
-
-    def __init__(self, start_time: Union[str, datetime, None] = None, **kwargs):
-        super().__init__(start_time=start_time, **kwargs)
-
-    def path(
-        self,
-        stream_state: Mapping[str, Any] = None,
-        stream_slice: Mapping[str, Any] = None,
-        next_page_token: Mapping[str, Any] = None
-    ) -> str:
-        tweet_id = stream_slice.get("id")
-        logger.debug("Fetching tweet %s from Account id %s", tweet_id, self.account_id)
-        return f"tweets/{tweet_id}"
+class TweetMetrics(TweetLookup):
+    tweet_fields = "non_public_metrics,organic_metrics,created_at"
 
-    def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
-        limit_date = datetime.today() - timedelta(31)
-        for parent_slice in super().stream_slices(sync_mode=SyncMode.full_refresh):
-            tweet = parent_slice["parent"]
-            if datetime.strptime(tweet.get("created_at"), "%Y-%m-%dT%H:%M:%S.%fZ") > limit_date:
-                yield {"id": tweet.get('id')}
-            else:
-                logger.info("Not calling promoted_metrics endpoint for tweet %s, tweet too old", tweet.get('id'))
-
-    def request_params(
-        self,
-        stream_state: Optional[Mapping[str, Any]],
-        stream_slice: Optional[Mapping[str, Any]] = None,
-        next_page_token: Optional[Mapping[str, Any]] = None,
-    ) -> MutableMapping[str, Any]:
-        params = {
-            "tweet.fields": "promoted_metrics",
-        }
-        logger.debug(f"DBG-FULL - query params: %s", params)
-        return params
-
-    def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        if 'data' in response.json():
-            data = response.json()['data']
-            yield data
-        elif 'error' in response.json():
-            logger.info("No promoted Metrics for this tweet")
-        self._apply_rate_limiting()
+class TweetPromoted(TweetLookup):
+    tweet_fields = "promoted_metrics"
@@ -2,22 +2,57 @@
 Source implementation for YouTube Data v3 API.
 """
 import logging
-from datetime import datetime, timezone
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Generator, Any, List, Mapping, MutableMapping, Optional, Iterable, Tuple, Iterator
 
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
-from airbyte_cdk.models import SyncMode, AirbyteCatalog, AirbyteStream
+from airbyte_cdk.models import SyncMode, AirbyteCatalog, AirbyteStream, AirbyteMessage, ConfiguredAirbyteCatalog
 
 import json
 import os
-from .utils import YouTubeDataAPI
+from .utils import QUOTA_COSTS, QuotaExceededError, QuotaLedger, YouTubeDataAPI
 
 logger = logging.getLogger("airbyte")
 
+# Channels read at the same time, each one by its own thread
+DEFAULT_MAX_CONCURRENT_CHANNELS = 32
+# Comment count lookups running at the same time, shared by the channels
+DEFAULT_MAX_CONCURRENT_COMMENT_LOOKUPS = 10
+
+
+def get_channel_identifiers(config: Mapping[str, Any]) -> List[str]:
+    """
+    Get the configured channels, a list or a comma separated string
+    """
+    channel_identifiers = config.get("channel_identifier") or []
+    if isinstance(channel_identifiers, str):
+        channel_identifiers = channel_identifiers.split(",")
+    return list(dict.fromkeys(identifier.strip() for identifier in channel_identifiers if identifier.strip()))
+
+
+def get_video_fingerprint(video: Mapping[str, Any]) -> List:
+    """
+    Get the compact fingerprint of a video kept in the state, its counts change with the
+    statistics and its etag with the metadata
+    """
+    return [video.get('view_count', 0), video.get('like_count', 0), video.get('comment_count', 0), video.get('etag', '')]
+
+
+def get_max_workers(config: Mapping[str, Any]) -> int:
+    """
+    Get the number of threads reading the channels
+    """
+    max_concurrent_channels = config.get("max_concurrent_channels") or DEFAULT_MAX_CONCURRENT_CHANNELS
+    return max(1, min(max_concurrent_channels, len(get_channel_identifiers(config))))
+
 
 class SourceYoutubeFetcher(AbstractSource):
   
+    youtube_client: Optional[YouTubeDataAPI] = None
     
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Any]:
         try:
@@ -26,50 +61,81 @@ class SourceYoutubeFetcher(AbstractSource):
                 return False, "Missing required field: api_key"
             
             # Initialize YouTube client
-            youtube_client = YouTubeDataAPI(api_key)
+            youtube_client = self.get_youtube_client(config)
           
-            channel_identifier = config.get("channel_identifier")
-            if not channel_identifier:
+            channel_identifiers = get_channel_identifiers(config)
+            if not channel_identifiers:
                 return False, "Missing required field: channel_identifier"
-     
-            channel_id = channel_identifier
-            if channel_identifier.startswith('@'):
-                channel_id = youtube_client.get_channel_id_by_handle(channel_identifier)
-            elif not channel_identifier.startswith('UC'):
-                channel_id = youtube_client.get_channel_id_by_username(channel_identifier)
-            
-            if not channel_id:
-                return False, f"Could not find channel for identifier: {channel_identifier}"
-            
-            # Test API connection
-            channel_info = youtube_client.get_channel_info(channel_id)
-            if not channel_info:
-                return False, f"Could not retrieve channel information for: {channel_identifier}"
             
-            logger.info(f"Successfully connected to YouTube channel: {channel_info.get('snippet', {}).get('title', channel_identifier)}")
+            with ThreadPoolExecutor(max_workers=get_max_workers(config)) as executor:
+                errors = [error for error in executor.map(lambda identifier: self.check_channel(youtube_client, identifier), channel_identifiers) if error]
+            if errors:
+                return False, "; ".join(errors)
             return True, None
             
         except Exception as e:
             return False, f"Error connecting to YouTube Data API: {str(e)}"
 
+    def check_channel(self, youtube_client: YouTubeDataAPI, channel_identifier: str) -> Optional[str]:
+        """
+        Check that a channel can be read, the error message if not
+        """
+        channel_id = youtube_client.resolve_channel_id(channel_identifier)
+        
+        if not channel_id:
+            return f"Could not find channel for identifier: {channel_identifier}"
+        
+        # Test API connection
+        channel_info = youtube_client.get_channel_info(channel_id)
+        if not channel_info:
+            return f"Could not retrieve channel information for: {channel_identifier}"
+        
+        logger.info(f"Successfully connected to YouTube channel: {channel_info.get('snippet', {}).get('title', channel_identifier)}")
+        return None
+
+    def get_youtube_client(self, config: Mapping[str, Any]) -> YouTubeDataAPI:
+        """
+        Get the client shared by the connection check and the streams, so the channel is
+        resolved and requested once per source and every request is charged to the same ledger
+        """
+        if self.youtube_client is None:
+            self.youtube_client = YouTubeDataAPI(
+                config.get("api_key"),
+                quota_ledger=QuotaLedger(config.get("daily_quota_budget")),
+                max_connections=get_max_workers(config),
+                max_comment_lookups=config.get("max_concurrent_comment_lookups") or DEFAULT_MAX_CONCURRENT_COMMENT_LOOKUPS
+            )
+        return self.youtube_client
+
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        youtube_client = self.get_youtube_client(config)
         return [
-            ChannelStream(config=config),
-            VideoStream(config=config)
+            ChannelStream(config=config, youtube_client=youtube_client),
+            VideoStream(config=config, youtube_client=youtube_client),
+            VideoStatisticsStream(config=config, youtube_client=youtube_client)
         ]
 
+    def read(self, logger: logging.Logger, config: Mapping[str, Any], catalog: ConfiguredAirbyteCatalog,
+             state: MutableMapping[str, Any] = None) -> Iterator[AirbyteMessage]:
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            if self.youtube_client:
+                logger.info(f"YouTube API quota usage: {json.dumps(self.youtube_client.quota_ledger.summary())}")
+
 
 class ChannelStream(Stream):
     """Stream for YouTube channel statistics and information"""
     
-    def __init__(self, config: Mapping[str, Any]):
+    def __init__(self, config: Mapping[str, Any], youtube_client: Optional[YouTubeDataAPI] = None):
         self.config = config
         self.api_key = config.get("api_key")
-        self.channel_identifier = config.get("channel_identifier")
+        self.channel_identifiers = get_channel_identifiers(config)
+        self.max_workers = get_max_workers(config)
         self.max_results = config.get("max_results")
         self.include_comments_count = config.get("include_comments_count", False)
         
-        self.youtube_client = YouTubeDataAPI(self.api_key)
+        self.youtube_client = youtube_client or YouTubeDataAPI(self.api_key)
 
     @property
     def name(self) -> str:
@@ -108,25 +174,27 @@ class ChannelStream(Stream):
             logger.error(f"Error loading schema from {schema_path}: {str(e)}")
             raise
 
-    def get_channel_id(self) -> str:
+    def get_channel_id(self, channel_identifier: str) -> str:
         """Get the actual channel ID from the identifier"""
-        channel_id = self.channel_identifier
-        
-        if self.channel_identifier.startswith('@'):
-            channel_id = self.youtube_client.get_channel_id_by_handle(self.channel_identifier)
-        elif not self.channel_identifier.startswith('UC'):
-            channel_id = self.youtube_client.get_channel_id_by_username(self.channel_identifier)
+        channel_id = self.youtube_client.resolve_channel_id(channel_identifier)
         
         if not channel_id:
-            raise ValueError(f"Could not find channel for identifier: {self.channel_identifier}")
+            raise ValueError(f"Could not find channel for identifier: {channel_identifier}")
         
         return channel_id
 
     def read_records(self, sync_mode: SyncMode, stream_slice: Optional[Mapping[str, Any]] = None, 
                      stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
-       
+        # The channels are fetched concurrently and emitted in the configured order
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as executor:
+            for channel_record in executor.map(self.read_channel, self.channel_identifiers):
+                if channel_record:
+                    yield channel_record
+
+    def read_channel(self, channel_identifier: str) -> Optional[Mapping[str, Any]]:
+        """Fetch the record of a channel, `None` if it was not found or the quota budget is reached"""
         try:
-            channel_id = self.get_channel_id()
+            channel_id = self.get_channel_id(channel_identifier)
             logger.info(f"Fetching channel information for: {channel_id}")
             
             # Get channel information
@@ -134,7 +202,7 @@ class ChannelStream(Stream):
             
             if not channel_info:
                 logger.warning(f"No channel information found for: {channel_id}")
-                return
+                return None
             
             snippet = channel_info.get('snippet', {})
             statistics = channel_info.get('statistics', {})
@@ -185,13 +253,16 @@ class ChannelStream(Stream):
                 
                 # Metadata
                 'fetched_at': datetime.now(timezone.utc).isoformat(),
-                'channel_identifier': self.channel_identifier,
-                'api_quota_used': 1  # Channel info costs 1 quota unit
+                'channel_identifier': channel_identifier,
+                'api_quota_used': self.youtube_client.channel_requests.get(channel_id, 0) * QUOTA_COSTS['channels']
             }
             
             logger.info(f"Successfully fetched channel data for: {channel_record['title']}")
-            yield channel_record
+            return channel_record
             
+        except QuotaExceededError as e:
+            logger.warning(f"Skipping channel data for {channel_identifier}: {str(e)}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching channel data: {str(e)}")
             raise
@@ -200,14 +271,26 @@ class ChannelStream(Stream):
 class VideoStream(Stream):
     """Stream for YouTube video statistics and information"""
     
-    def __init__(self, config: Mapping[str, Any]):
+    # Videos published within this window before the cursor are read again to refresh their statistics
+    DEFAULT_LOOKBACK_DAYS = 7
+    
+    def __init__(self, config: Mapping[str, Any], youtube_client: Optional[YouTubeDataAPI] = None):
         self.config = config
         self.api_key = config.get("api_key")
-        self.channel_identifier = config.get("channel_identifier")
+        self.channel_identifiers = get_channel_identifiers(config)
+        self.max_workers = get_max_workers(config)
         self.max_results = config.get("max_results")
         self.include_comments_count = config.get("include_comments_count", False)
+        self.start_date = config.get("start_date")
+        self.lookback_days = config.get("lookback_days", self.DEFAULT_LOOKBACK_DAYS)
+        self.changed_videos_only = config.get("changed_videos_only", False)
         
-        self.youtube_client = YouTubeDataAPI(self.api_key)
+        self.youtube_client = youtube_client or YouTubeDataAPI(self.api_key)
+        self._state = {}
+        # Video batches fetched by the channel threads, until their slice is read
+        self._prefetched = {}
+        # Videos emitted or skipped as unchanged in this sync, by channel ID
+        self._seen_videos = {}
 
     @property
     def name(self) -> str:
@@ -219,7 +302,7 @@ class VideoStream(Stream):
 
     def get_json_schema(self) -> Mapping[str, Any]:
         """Load JSON schema for the stream"""
-        schema_path = os.path.join(os.path.dirname(__file__), "schemas", "videos.json")
+        schema_path = os.path.join(os.path.dirname(__file__), "schemas", f"{self.name}.json")
         logger.info(f"Looking for schema file at: {schema_path}")
         
         if not os.path.exists(schema_path):
@@ -246,73 +329,233 @@ class VideoStream(Stream):
             logger.error(f"Error loading schema from {schema_path}: {str(e)}")
             raise
 
-    def get_channel_id(self) -> str:
-        channel_id = self.channel_identifier
-        
-        if self.channel_identifier.startswith('@'):
-            channel_id = self.youtube_client.get_channel_id_by_handle(self.channel_identifier)
-        elif not self.channel_identifier.startswith('UC'):
-            channel_id = self.youtube_client.get_channel_id_by_username(self.channel_identifier)
+    @property
+    def state(self) -> MutableMapping[str, Any]:
+        return self._state
+
+    @state.setter
+    def state(self, value: MutableMapping[str, Any]):
+        self._state = value
+
+    def get_channel_id(self, channel_identifier: str) -> str:
+        channel_id = self.youtube_client.resolve_channel_id(channel_identifier)
         
         if not channel_id:
-            raise ValueError(f"Could not find channel for identifier: {self.channel_identifier}")
+            raise ValueError(f"Could not find channel for identifier: {channel_identifier}")
         
         return channel_id
 
-    def read_records(self, sync_mode: SyncMode, stream_slice: Optional[Mapping[str, Any]] = None, 
-                     stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+    def get_channel_state(self, channel_id: str) -> Mapping[str, Any]:
+        """
+        Get the state of a channel, the cursor of a single channel sync applies to
+        channels without their own state
+        """
+        channel_state = self.state.get('channels', {}).get(channel_id) or {}
+        if not channel_state.get(self.cursor_field) and self.state.get(self.cursor_field):
+            return {**channel_state, self.cursor_field: self.state[self.cursor_field]}
+        return channel_state
+
+    def get_published_after(self, sync_mode: SyncMode, stream_state: Mapping[str, Any] = None) -> Optional[datetime]:
+        """
+        Get the oldest publication date to read in incremental mode: the stored cursor minus
+        the lookback window, or `start_date` on the first sync
+        """
+        if sync_mode != SyncMode.incremental:
+            return None
+        
+        cursor_value = (stream_state or {}).get(self.cursor_field)
+        if cursor_value:
+            return datetime.fromisoformat(cursor_value.replace('Z', '+00:00')) - timedelta(days=self.lookback_days)
+        
+        if self.start_date:
+            return datetime.fromisoformat(self.start_date).replace(tzinfo=timezone.utc)
+        return None
+
+    def get_max_results(self) -> Optional[int]:
+        if self.max_results and self.max_results != "all":
+            try:
+                return int(self.max_results)
+            except ValueError:
+                logger.warning(f"Invalid max_results value: {self.max_results}, fetching all videos")
+        return None
+
+    def read_channel(self, channel_identifier: str, sync_mode: SyncMode) -> Iterator[Tuple[Mapping[str, Any], List[Mapping[str, Any]]]]:
+        """
+        Fetch the videos of a channel, one slice per batch of up to 50 videos.
+        
+        The uploads playlist is read newest first, a walk stopped before its end would skip older
+        videos on the next sync, so the channel cursor only moves with a last slice marking the
+        channel `complete`. A channel stopped by the quota budget keeps its previous cursor.
+        """
         try:
-            channel_id = self.get_channel_id()
+            channel_id = self.get_channel_id(channel_identifier)
             logger.info(f"Fetching videos for channel: {channel_id}")
             
-            max_results = None
-            if self.max_results and self.max_results != "all":
-                try:
-                    max_results = int(self.max_results)
-                except ValueError:
-                    logger.warning(f"Invalid max_results value: {self.max_results}, fetching all videos")
+            published_after = self.get_published_after(sync_mode, self.get_channel_state(channel_id))
+            if published_after:
+                logger.info(f"Fetching videos of {channel_id} published after: {published_after.isoformat()}")
             
-            videos = self.youtube_client.get_all_channel_videos(
-                channel_identifier=self.channel_identifier,
-                max_results=max_results,
-                include_comments_count=self.include_comments_count
-            )
+            # Each batch of up to 50 videos is emitted as soon as it is fetched
+            video_count = 0
+            last_published_at = None
+            for batch, videos in enumerate(self.get_video_batches(channel_identifier, published_after)):
+                video_records = [self.get_video_record(video, channel_id, channel_identifier) for video in videos]
+                for video in videos:
+                    if video.get('published_at') and (not last_published_at or video['published_at'] > last_published_at):
+                        last_published_at = video['published_at']
+                
+                yield {'channel_identifier': channel_identifier, 'channel_id': channel_id, 'batch': batch}, video_records
+                video_count += len(videos)
             
-            if not videos:
+            if not video_count:
                 logger.warning(f"No videos found for channel: {channel_id}")
-                return
-            
-            logger.info(f"Successfully fetched {len(videos)} videos from channel")
+            else:
+                logger.info(f"Successfully fetched {video_count} videos from channel {channel_id}")
             
-            # Process each video
-            for video in videos:
-                # The video data is already comprehensive from the API client
-                # Add some additional metadata for Airbyte
-                video_record = {
-                    **video,  # Include all existing video data
-                    '_airbyte_channel_identifier': self.channel_identifier,
-                    '_airbyte_sync_time': datetime.now(timezone.utc).isoformat(),
-                }
-                
-                yield video_record
+            yield {'channel_identifier': channel_identifier, 'channel_id': channel_id, 'complete': True, self.cursor_field: last_published_at}, []
+        
+        except QuotaExceededError as e:
+            logger.warning(f"Stopping the videos of {channel_identifier}: {str(e)}")
                 
         except Exception as e:
-            logger.error(f"Error fetching video data: {str(e)}")
+            logger.error(f"Error fetching video data for {channel_identifier}: {str(e)}")
             raise
 
+    def get_video_batches(self, channel_identifier: str, published_after: Optional[datetime]) -> Iterator[List[Dict]]:
+        return self.youtube_client.get_channel_video_batches(
+            channel_identifier=channel_identifier,
+            max_results=self.get_max_results(),
+            include_comments_count=self.include_comments_count,
+            published_after=published_after
+        )
+
+    def get_video_record(self, video: Mapping[str, Any], channel_id: str, channel_identifier: str) -> Mapping[str, Any]:
+        # The video data is already comprehensive from the API client
+        # Add some additional metadata for Airbyte
+        return {
+            **video,  # Include all existing video data
+            'channel_id': video.get('channel_id') or channel_id,
+            '_airbyte_channel_identifier': channel_identifier,
+            '_airbyte_sync_time': datetime.now(timezone.utc).isoformat(),
+        }
+
+    def read_channels(self, sync_mode: SyncMode) -> Iterable[Mapping[str, Any]]:
+        """
+        Read the channels concurrently, one thread per channel up to `max_concurrent_channels`.
+        Each slice is yielded once its videos are fetched and `read_records` replays them, the
+        queue holds a few batches per thread so a slow destination pauses the threads.
+        """
+        output = queue.Queue(maxsize=2 * self.max_workers)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    output.put(item, timeout=1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_channel(channel_identifier: str):
+            try:
+                for channel_slice, video_records in self.read_channel(channel_identifier, sync_mode):
+                    if stop.is_set():
+                        return
+                    put((channel_slice, video_records))
+            finally:
+                put((channel_identifier, None))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name) as executor:
+            futures = {identifier: executor.submit(read_channel, identifier) for identifier in self.channel_identifiers}
+            try:
+                remaining = len(futures)
+                while remaining:
+                    channel_slice, video_records = output.get()
+                    if video_records is None:
+                        remaining -= 1
+                        # Raise the exception of the channel thread, if any
+                        futures[channel_slice].result()
+                        continue
+
+                    self._prefetched[self.slice_key(channel_slice)] = video_records
+                    yield channel_slice
+            finally:
+                stop.set()
+
+    def slice_key(self, stream_slice: Mapping[str, Any]) -> str:
+        return json.dumps(stream_slice, sort_keys=True)
+
+    def read_records(self, sync_mode: SyncMode, stream_slice: Optional[Mapping[str, Any]] = None, 
+                     stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
+        if stream_slice is None:
+            # Read without slices, one channel after the other
+            for identifier in self.channel_identifiers:
+                for channel_slice, video_records in self.read_channel(identifier, sync_mode):
+                    yield from self.read_slice(sync_mode, channel_slice, video_records)
+            return
+        
+        yield from self.read_slice(sync_mode, stream_slice, self._prefetched.pop(self.slice_key(stream_slice), []))
+
+    def read_slice(self, sync_mode: SyncMode, stream_slice: Mapping[str, Any], video_records: List[Mapping[str, Any]]) -> Iterable[Mapping[str, Any]]:
+        """
+        Emit the videos of a slice, or move the cursor of a completely read channel
+        """
+        channel_id = stream_slice['channel_id']
+        if stream_slice.get('complete'):
+            channel_state = self.get_channel_state(channel_id)
+            cursor_value = max(filter(None, [channel_state.get(self.cursor_field), stream_slice.get(self.cursor_field)]), default=None)
+            if cursor_value:
+                self._state.setdefault('channels', {}).setdefault(channel_id, {})[self.cursor_field] = cursor_value
+            self.prune_fingerprints(channel_id)
+        
+        if not self.tracks_fingerprints(sync_mode):
+            yield from video_records
+            return
+        
+        fingerprints = self._state.setdefault('channels', {}).setdefault(channel_id, {}).setdefault('videos', {})
+        seen_videos = self._seen_videos.setdefault(channel_id, set())
+        for video_record in video_records:
+            fingerprint = get_video_fingerprint(video_record)
+            previous_fingerprint = fingerprints.get(video_record['video_id'])
+            seen_videos.add(video_record['video_id'])
+            if fingerprint != previous_fingerprint:
+                fingerprints[video_record['video_id']] = fingerprint
+                if self.is_changed(fingerprint, previous_fingerprint):
+                    yield self.get_changed_record(video_record, previous_fingerprint)
+
+    def tracks_fingerprints(self, sync_mode: SyncMode) -> bool:
+        """
+        Whether the fingerprints of the videos are kept in the state, only incremental syncs keep a state
+        """
+        return self.changed_videos_only and sync_mode == SyncMode.incremental
+
+    def is_changed(self, fingerprint: List, previous_fingerprint: Optional[List]) -> bool:
+        """
+        Whether a video whose fingerprint differs from the one in the state is emitted
+        """
+        return True
+
+    def get_changed_record(self, video_record: Mapping[str, Any], previous_fingerprint: Optional[List]) -> Mapping[str, Any]:
+        return video_record
+
+    def prune_fingerprints(self, channel_id: str):
+        """
+        Drop the fingerprints of the videos the walk of a channel did not reach, they are out of
+        the lookback window and will not be read again
+        """
+        channel_state = self._state.get('channels', {}).get(channel_id, {})
+        if 'videos' in channel_state:
+            seen_videos = self._seen_videos.get(channel_id, set())
+            channel_state['videos'] = {video_id: fingerprint for video_id, fingerprint in channel_state['videos'].items() if video_id in seen_videos}
+
     def get_updated_state(self, current_stream_state: MutableMapping[str, Any], 
                          latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
-        # Use published_at as the cursor for incremental sync
-        published_at = latest_record.get('published_at')
-        if published_at:
-            current_stream_state['published_at'] = published_at
-        return current_stream_state
+        # The cursor of each channel is moved once the channel is completely read, see `read_channel`
+        return self.state
 
     def stream_slices(self, sync_mode: SyncMode, cursor_field: List[str] = None, 
                      stream_state: Mapping[str, Any] = None) -> Iterable[Optional[Mapping[str, Any]]]:
-      
-        # For YouTube videos, we use a single slice since we fetch all videos at once
-        yield None
+        yield from self.read_channels(sync_mode)
 
     def supports_incremental(self) -> bool:
         return True
@@ -324,3 +567,67 @@ class VideoStream(Stream):
     @property
     def source_defined_cursor(self) -> bool:
         return True
+
+
+class VideoStatisticsStream(VideoStream):
+    """
+    Append-only time series of the video statistics, one record per video whose counts
+    changed since the last sync with the change of each count
+    """
+
+    @property
+    def name(self) -> str:
+        return "video_statistics"
+
+    @property
+    def primary_key(self) -> Optional[List[str]]:
+        return ["video_id", "fetched_at"]
+
+    @property
+    def cursor_field(self) -> str:
+        return "fetched_at"
+
+    def get_published_after(self, sync_mode: SyncMode, stream_state: Mapping[str, Any] = None) -> Optional[datetime]:
+        # The counts of older videos keep changing, every sync walks the whole uploads playlist
+        if sync_mode == SyncMode.incremental and self.start_date:
+            return datetime.fromisoformat(self.start_date).replace(tzinfo=timezone.utc)
+        return None
+
+    def get_video_batches(self, channel_identifier: str, published_after: Optional[datetime]) -> Iterator[List[Dict]]:
+        return self.youtube_client.get_channel_statistics_batches(
+            channel_identifier=channel_identifier,
+            max_results=self.get_max_results(),
+            published_after=published_after
+        )
+
+    def get_video_record(self, video: Mapping[str, Any], channel_id: str, channel_identifier: str) -> Mapping[str, Any]:
+        statistics = video.get('statistics', {})
+        return {
+            'video_id': video['id'],
+            'channel_id': channel_id,
+            'fetched_at': datetime.now(timezone.utc).isoformat(),
+            'etag': video.get('etag', ''),
+            'view_count': int(statistics.get('viewCount', 0)),
+            'like_count': int(statistics.get('likeCount', 0)),
+            'comment_count': int(statistics.get('commentCount', 0)),
+            'favorite_count': int(statistics.get('favoriteCount', 0)),
+            '_airbyte_channel_identifier': channel_identifier,
+        }
+
+    def tracks_fingerprints(self, sync_mode: SyncMode) -> bool:
+        return sync_mode == SyncMode.incremental
+
+    def is_changed(self, fingerprint: List, previous_fingerprint: Optional[List]) -> bool:
+        # A change of the etag alone is a metadata change, the series only records the counts
+        return previous_fingerprint is None or fingerprint[:3] != previous_fingerprint[:3]
+
+    def get_changed_record(self, video_record: Mapping[str, Any], previous_fingerprint: Optional[List]) -> Mapping[str, Any]:
+        # Without a previous fingerprint the video is new to the series and has no change yet
+        previous_counts = previous_fingerprint[:3] if previous_fingerprint else [None, None, None]
+        return {
+            **video_record,
+            **{
+                f"{count}_delta": video_record[count] - previous_count if previous_count is not None else None
+                for count, previous_count in zip(['view_count', 'like_count', 'comment_count'], previous_counts)
+            },
+        }
@@ -1,43 +1,229 @@
 import requests
 import json
-from typing import List, Dict, Optional, Iterator
+from typing import List, Dict, Optional, Iterator, Tuple
 from datetime import datetime, timezone
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Quota units charged by the YouTube Data API for one request to each endpoint
+QUOTA_COSTS = {
+    'channels': 1,
+    'playlistItems': 1,
+    'videos': 1,
+    'commentThreads': 1,
+}
+
+
+class QuotaExceededError(Exception):
+    """
+    Raised when a request would exceed the configured quota budget.
+    """
+
+
+class QuotaLedger:
+    """
+    Quota units used by the requests of a run, checked against an optional budget.
+    """
+    
+    def __init__(self, budget: Optional[int] = None):
+        """
+        Initialize the ledger.
+        
+        Args:
+            budget (Optional[int]): Quota units the run may use, unlimited if not set
+        """
+        self.budget = budget
+        self.calls = {endpoint: 0 for endpoint in QUOTA_COSTS}
+        self.skipped = {endpoint: 0 for endpoint in QUOTA_COSTS}
+        # Requests reserved ahead of being made, their units are not available to other requests
+        self.held = {endpoint: 0 for endpoint in QUOTA_COSTS}
+        self._lock = threading.Lock()
+    
+    @property
+    def used(self) -> int:
+        """
+        Quota units used so far.
+        """
+        return sum(QUOTA_COSTS.get(endpoint, 1) * calls for endpoint, calls in self.calls.items())
+    
+    @property
+    def held_units(self) -> int:
+        """
+        Quota units reserved for requests that were not made yet.
+        """
+        return sum(QUOTA_COSTS.get(endpoint, 1) * held for endpoint, held in self.held.items())
+    
+    @property
+    def remaining(self) -> Optional[int]:
+        """
+        Quota units left in the budget, `None` without a budget.
+        """
+        if self.budget is None:
+            return None
+        return max(self.budget - self.used, 0)
+    
+    def can_spend(self, endpoint: str, reserve: int = 0) -> bool:
+        """
+        Check if a request to an endpoint fits in the budget.
+        
+        Args:
+            endpoint (str): API endpoint
+            reserve (int): Quota units to keep for other requests
+            
+        Returns:
+            bool: Whether the request can be made
+        """
+        if self.budget is None:
+            return True
+        return self.used + self.held_units + QUOTA_COSTS.get(endpoint, 1) + reserve <= self.budget
+    
+    def reserve(self, endpoint: str, count: int, keep: int = 0) -> int:
+        """
+        Hold the units of up to `count` requests to an endpoint, checked against the budget
+        and held in one step so concurrent callers can't spend the same units.
+        
+        Args:
+            endpoint (str): API endpoint
+            count (int): Number of requests wanted
+            keep (int): Quota units to leave for other requests
+            
+        Returns:
+            int: Number of requests held, each one is made with `charge(endpoint, held=True)`
+            or given back with `release`
+        """
+        with self._lock:
+            if self.budget is None:
+                granted = count
+            else:
+                available = self.budget - self.used - self.held_units - keep
+                granted = max(min(count, available // QUOTA_COSTS.get(endpoint, 1)), 0)
+            self.held[endpoint] = self.held.get(endpoint, 0) + granted
+            return granted
+    
+    def release(self, endpoint: str, count: int = 1) -> None:
+        """
+        Give back held requests that were not made.
+        
+        Args:
+            endpoint (str): API endpoint
+            count (int): Number of held requests
+        """
+        with self._lock:
+            self.held[endpoint] = max(self.held.get(endpoint, 0) - count, 0)
+    
+    def charge(self, endpoint: str, held: bool = False) -> None:
+        """
+        Record a request to an endpoint.
+        
+        Args:
+            endpoint (str): API endpoint
+            held (bool): Whether the request was held with `reserve`, its units are already counted
+            
+        Raises:
+            QuotaExceededError: If the request would exceed the budget
+        """
+        with self._lock:
+            if held and self.held.get(endpoint, 0) > 0:
+                self.held[endpoint] -= 1
+            elif not self.can_spend(endpoint):
+                raise QuotaExceededError(
+                    f"Quota budget of {self.budget} units reached, {self.used} units used"
+                )
+            self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+    
+    def skip(self, endpoint: str) -> None:
+        """
+        Record an optional request that was not made to save quota.
+        
+        Args:
+            endpoint (str): API endpoint
+        """
+        with self._lock:
+            if not any(self.skipped.values()):
+                logger.warning(f"Quota budget almost reached, skipping optional {endpoint} requests")
+            self.skipped[endpoint] = self.skipped.get(endpoint, 0) + 1
+    
+    def summary(self) -> Dict:
+        """
+        Summarize the quota usage of the run.
+        
+        Returns:
+            Dict: Units used, budget, and calls and skipped requests per endpoint
+        """
+        return {
+            'used': self.used,
+            'budget': self.budget,
+            'remaining': self.remaining,
+            'calls': {endpoint: calls for endpoint, calls in self.calls.items() if calls},
+            'skipped': {endpoint: skipped for endpoint, skipped in self.skipped.items() if skipped},
+        }
+
 
 class YouTubeDataAPI:
     """
     YouTube Data v3 API client for fetching channel videos with comprehensive statistics.
     """
     
-    def __init__(self, api_key: str):
+    # Quota kept for the next uploads playlist page and its videos batch when optional requests are made
+    CORE_QUOTA_RESERVE = QUOTA_COSTS['playlistItems'] + QUOTA_COSTS['videos']
+    
+    # Parts of a channel, fetched by the handle and username lookups too so the channel is requested once
+    CHANNEL_PARTS = 'snippet,statistics,brandingSettings,contentDetails,topicDetails,status'
+    
+    def __init__(self, api_key: str, quota_ledger: Optional[QuotaLedger] = None, max_connections: int = 10,
+                 max_comment_lookups: int = 10):
         """
         Initialize the YouTube Data API client.
         
         Args:
             api_key (str): YouTube Data API v3 key
+            quota_ledger (Optional[QuotaLedger]): Ledger charged for every request, unlimited if not set
+            max_connections (int): Connections kept open by the session, one per thread using the client
+            max_comment_lookups (int): Comment count lookups running at the same time, shared by every thread
         """
         self.api_key = api_key
         self.base_url = "https://www.googleapis.com/youtube/v3"
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_connections + max_comment_lookups)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.quota_ledger = quota_ledger or QuotaLedger()
+        
+        # Resolved channel IDs by identifier and channel information by ID, kept for the client's lifetime
+        self._channel_ids = {}
+        self._channel_info = {}
+        # Channel requests made for each channel ID
+        self.channel_requests = {}
         
-    def _make_request(self, endpoint: str, params: Dict) -> Dict:
+        # Comment counts by video ID, looked up once per client by a pool shared by the channel threads
+        self._comment_counts = {}
+        self._comment_lookups = ThreadPoolExecutor(max_workers=max_comment_lookups, thread_name_prefix='comment_lookups')
+        
+    def _make_request(self, endpoint: str, params: Dict, held: bool = False) -> Dict:
         """
         Make a request to the YouTube API with error handling and rate limiting.
         
         Args:
             endpoint (str): API endpoint
             params (Dict): Request parameters
+            held (bool): Whether the quota of the request was held with `QuotaLedger.reserve`
             
         Returns:
             Dict: API response
+            
+        Raises:
+            QuotaExceededError: If the request would exceed the quota budget
         """
         params['key'] = self.api_key
         url = f"{self.base_url}/{endpoint}"
         
+        # Charged before the request, YouTube counts failed requests as well
+        self.quota_ledger.charge(endpoint, held=held)
+        
         try:
             response = self.session.get(url, params=params)
             response.raise_for_status()
@@ -46,6 +232,7 @@ class YouTubeDataAPI:
             if response.status_code == 429:
                 logger.warning("Rate limit exceeded, waiting 60 seconds...")
                 time.sleep(60)
+                self.quota_ledger.charge(endpoint)
                 response = self.session.get(url, params=params)
                 response.raise_for_status()
                 
@@ -55,6 +242,29 @@ class YouTubeDataAPI:
             logger.error(f"API request failed: {e}")
             raise
     
+    def resolve_channel_id(self, channel_identifier: str) -> Optional[str]:
+        """
+        Get the channel ID of a channel ID, username, or handle, resolved once per identifier.
+        
+        Args:
+            channel_identifier (str): Channel ID, username, or handle
+            
+        Returns:
+            Optional[str]: Channel ID if found
+        """
+        if channel_identifier not in self._channel_ids:
+            channel_id = channel_identifier
+            
+            if channel_identifier.startswith('@'):
+                channel_id = self.get_channel_id_by_handle(channel_identifier)
+            elif not channel_identifier.startswith('UC'):
+                # Assume it's a username
+                channel_id = self.get_channel_id_by_username(channel_identifier)
+            
+            self._channel_ids[channel_identifier] = channel_id
+        
+        return self._channel_ids[channel_identifier]
+    
     def get_channel_id_by_username(self, username: str) -> Optional[str]:
         """
         Get channel ID from username.
@@ -66,15 +276,11 @@ class YouTubeDataAPI:
             Optional[str]: Channel ID if found
         """
         params = {
-            'part': 'id',
+            'part': self.CHANNEL_PARTS,
             'forUsername': username
         }
         
-        response = self._make_request('channels', params)
-        
-        if response.get('items'):
-            return response['items'][0]['id']
-        return None
+        return self._cache_channel(self._make_request('channels', params))
     
     def get_channel_id_by_handle(self, handle: str) -> Optional[str]:
         """
@@ -91,19 +297,42 @@ class YouTubeDataAPI:
             handle = handle[1:]
             
         params = {
-            'part': 'id',
+            'part': self.CHANNEL_PARTS,
             'forHandle': handle
         }
         
-        response = self._make_request('channels', params)
+        return self._cache_channel(self._make_request('channels', params))
+    
+    def _cache_channel(self, response: Dict) -> Optional[str]:
+        """
+        Keep the channel of a `channels.list` lookup for `get_channel_info`.
         
-        if response.get('items'):
-            return response['items'][0]['id']
-        return None
+        Args:
+            response (Dict): API response
+            
+        Returns:
+            Optional[str]: Channel ID if found
+        """
+        if not response.get('items'):
+            return None
+        
+        channel_info = response['items'][0]
+        self._channel_info[channel_info['id']] = channel_info
+        self._count_channel_request(channel_info['id'])
+        return channel_info['id']
+    
+    def _count_channel_request(self, channel_id: str) -> None:
+        """
+        Count a `channels.list` request made for a channel.
+        
+        Args:
+            channel_id (str): YouTube channel ID
+        """
+        self.channel_requests[channel_id] = self.channel_requests.get(channel_id, 0) + 1
     
     def get_channel_info(self, channel_id: str) -> Dict:
         """
-        Get comprehensive channel information.
+        Get comprehensive channel information, requested once per channel.
         
         Args:
             channel_id (str): YouTube channel ID
@@ -111,14 +340,19 @@ class YouTubeDataAPI:
         Returns:
             Dict: Channel information
         """
+        if channel_id in self._channel_info:
+            return self._channel_info[channel_id]
+        
         params = {
-            'part': 'snippet,statistics,brandingSettings,contentDetails,topicDetails,status',
+            'part': self.CHANNEL_PARTS,
             'id': channel_id
         }
         
         response = self._make_request('channels', params)
+        self._count_channel_request(channel_id)
         
         if response.get('items'):
+            self._channel_info[channel_id] = response['items'][0]
             return response['items'][0]
         return {}
     
@@ -138,13 +372,18 @@ class YouTubeDataAPI:
             return channel_info['contentDetails']['relatedPlaylists'].get('uploads')
         return None
     
-    def get_playlist_videos(self, playlist_id: str, max_results: Optional[int] = None) -> Iterator[Dict]:
+    def get_playlist_videos(self, playlist_id: str, max_results: Optional[int] = None,
+                            published_after: Optional[datetime] = None) -> Iterator[Dict]:
         """
         Get all videos from a playlist with pagination.
         
+        Uploads playlists are sorted newest first, so the walk stops at the first
+        video published before `published_after`.
+        
         Args:
             playlist_id (str): YouTube playlist ID
             max_results (Optional[int]): Maximum number of videos to fetch
+            published_after (Optional[datetime]): Stop at videos published before this date
             
         Yields:
             Dict: Video information
@@ -167,14 +406,34 @@ class YouTubeDataAPI:
             for item in response.get('items', []):
                 if max_results and videos_fetched >= max_results:
                     return
+                
+                item_published_at = self._get_item_published_at(item)
+                if published_after and item_published_at and item_published_at < published_after:
+                    logger.info(f"Reached videos published before {published_after.isoformat()}, stopping after {videos_fetched} videos")
+                    return
                     
                 yield item
                 videos_fetched += 1
             
             next_page_token = response.get('nextPageToken')
-            if not next_page_token:
+            if not next_page_token or (max_results and videos_fetched >= max_results):
                 break
     
+    def _get_item_published_at(self, item: Dict) -> Optional[datetime]:
+        """
+        Get the publication date of a playlist item's video.
+        
+        Args:
+            item (Dict): Playlist item
+            
+        Returns:
+            Optional[datetime]: Video publication date, or when it was added to the playlist
+        """
+        published_at = item.get('contentDetails', {}).get('videoPublishedAt') or item.get('snippet', {}).get('publishedAt')
+        if not published_at:
+            return None
+        return datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+    
     def get_video_details(self, video_ids: List[str]) -> List[Dict]:
         """
         Get detailed information for multiple videos.
@@ -199,12 +458,34 @@ class YouTubeDataAPI:
         response = self._make_request('videos', params)
         return response.get('items', [])
     
-    def get_video_comments_count(self, video_id: str) -> int:
+    def get_video_statistics(self, video_ids: List[str]) -> List[Dict]:
+        """
+        Get the statistics of multiple videos.
+        
+        Args:
+            video_ids (List[str]): List of video IDs (max 50 per request)
+            
+        Returns:
+            List[Dict]: Video resources with `id`, `etag` and `statistics`
+        """
+        if not video_ids:
+            return []
+        
+        params = {
+            'part': 'statistics',
+            'id': ','.join(video_ids[:50])
+        }
+        
+        response = self._make_request('videos', params)
+        return response.get('items', [])
+    
+    def get_video_comments_count(self, video_id: str, held: bool = False) -> int:
         """
         Get comment count for a specific video.
         
         Args:
             video_id (str): YouTube video ID
+            held (bool): Whether the quota of the lookup was held with `QuotaLedger.reserve`
             
         Returns:
             int: Number of comments
@@ -216,13 +497,46 @@ class YouTubeDataAPI:
                 'maxResults': 1
             }
             
-            response = self._make_request('commentThreads', params)
+            response = self._make_request('commentThreads', params, held=held)
             return response.get('pageInfo', {}).get('totalResults', 0)
             
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.warning(f"Could not fetch comments for video {video_id}: {e}")
             return 0
     
+    def get_comment_counts(self, video_ids: List[str]) -> Dict[str, int]:
+        """
+        Get the comment counts of multiple videos, looked up concurrently.
+        
+        Counts already looked up are not requested again. Lookups are skipped once the
+        quota budget is only enough for the rest of the uploads playlist walk.
+        
+        Args:
+            video_ids (List[str]): List of video IDs
+            
+        Returns:
+            Dict[str, int]: Number of comments by video ID, without the skipped videos
+        """
+        candidates = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in self._comment_counts]
+        # Held in one step, leaving the units of the next playlist page and videos batch
+        granted = self.quota_ledger.reserve('commentThreads', len(candidates), keep=self.CORE_QUOTA_RESERVE)
+        lookups = candidates[:granted]
+        for _ in candidates[granted:]:
+            self.quota_ledger.skip('commentThreads')
+        
+        futures = {video_id: self._comment_lookups.submit(self.get_video_comments_count, video_id, True) for video_id in lookups}
+        for video_id, future in futures.items():
+            try:
+                self._comment_counts[video_id] = future.result()
+            except QuotaExceededError:
+                # The lookup was not made, its units are given back
+                self.quota_ledger.release('commentThreads')
+                self.quota_ledger.skip('commentThreads')
+        
+        return {video_id: self._comment_counts[video_id] for video_id in video_ids if video_id in self._comment_counts}
+    
     def get_all_channel_videos(self, channel_identifier: str, max_results: Optional[int] = None, 
                              include_comments_count: bool = False) -> List[Dict]:
         """
@@ -236,14 +550,74 @@ class YouTubeDataAPI:
         Returns:
             List[Dict]: Complete video data with statistics
         """
-        # Determine if it's a channel ID, username, or handle
-        channel_id = channel_identifier
+        all_videos = []
+        for video_batch in self.get_channel_video_batches(channel_identifier, max_results, include_comments_count):
+            all_videos.extend(video_batch)
         
-        if channel_identifier.startswith('@'):
-            channel_id = self.get_channel_id_by_handle(channel_identifier)
-        elif not channel_identifier.startswith('UC'):
-            # Assume it's a username
-            channel_id = self.get_channel_id_by_username(channel_identifier)
+        logger.info(f"Successfully fetched {len(all_videos)} videos")
+        return all_videos
+    
+    def get_channel_video_batches(self, channel_identifier: str, max_results: Optional[int] = None,
+                                  include_comments_count: bool = False,
+                                  published_after: Optional[datetime] = None) -> Iterator[List[Dict]]:
+        """
+        Get the videos of a channel one `videos.list` batch at a time.
+        
+        Each batch of up to 50 videos is yielded as soon as it is enriched, so only
+        one batch is kept in memory whatever the size of the channel.
+        
+        Args:
+            channel_identifier (str): Channel ID, username, or handle
+            max_results (Optional[int]): Maximum number of videos to fetch
+            include_comments_count (bool): Whether to fetch comment counts (slower)
+            published_after (Optional[datetime]): Only fetch videos published after this date
+            
+        Yields:
+            List[Dict]: Complete video data with statistics, for up to 50 videos
+        """
+        channel_id, uploads_playlist_id = self._get_uploads_playlist(channel_identifier)
+        
+        # Get channel info for context, already cached by the playlist lookup
+        channel_info = self.get_channel_info(channel_id)
+        
+        logger.info(f"Fetching videos from channel: {channel_info.get('snippet', {}).get('title', channel_id)}")
+        
+        for video_batch in self._get_playlist_video_id_batches(uploads_playlist_id, max_results, published_after):
+            yield self._get_enhanced_videos(video_batch, channel_info, include_comments_count)
+    
+    def get_channel_statistics_batches(self, channel_identifier: str, max_results: Optional[int] = None,
+                                       published_after: Optional[datetime] = None) -> Iterator[List[Dict]]:
+        """
+        Get the statistics of the videos of a channel one `videos.list` batch at a time.
+        
+        Only the `statistics` part is requested, the responses are a fraction of the
+        size of `get_channel_video_batches` for the same quota.
+        
+        Args:
+            channel_identifier (str): Channel ID, username, or handle
+            max_results (Optional[int]): Maximum number of videos to fetch
+            published_after (Optional[datetime]): Only fetch videos published after this date
+            
+        Yields:
+            List[Dict]: Video resources with `id`, `etag` and `statistics`, for up to 50 videos
+        """
+        _, uploads_playlist_id = self._get_uploads_playlist(channel_identifier)
+        
+        for video_batch in self._get_playlist_video_id_batches(uploads_playlist_id, max_results, published_after):
+            yield self.get_video_statistics(video_batch)
+    
+    def _get_uploads_playlist(self, channel_identifier: str) -> Tuple[str, str]:
+        """
+        Get the channel ID and uploads playlist ID of a channel.
+        
+        Args:
+            channel_identifier (str): Channel ID, username, or handle
+            
+        Returns:
+            Tuple[str, str]: Channel ID and uploads playlist ID
+        """
+        # Determine if it's a channel ID, username, or handle
+        channel_id = self.resolve_channel_id(channel_identifier)
         
         if not channel_id:
             raise ValueError(f"Could not find channel for identifier: {channel_identifier}")
@@ -253,27 +627,31 @@ class YouTubeDataAPI:
         if not uploads_playlist_id:
             raise ValueError(f"Could not find uploads playlist for channel: {channel_id}")
         
-        # Get channel info for context
-        channel_info = self.get_channel_info(channel_id)
+        return channel_id, uploads_playlist_id
+    
+    def _get_playlist_video_id_batches(self, playlist_id: str, max_results: Optional[int] = None,
+                                       published_after: Optional[datetime] = None) -> Iterator[List[str]]:
+        """
+        Get the video IDs of a playlist in batches of 50, the `videos.list` limit.
         
-        all_videos = []
+        Args:
+            playlist_id (str): YouTube playlist ID
+            max_results (Optional[int]): Maximum number of videos to fetch
+            published_after (Optional[datetime]): Stop at videos published before this date
+            
+        Yields:
+            List[str]: Up to 50 video IDs
+        """
         video_batch = []
         
-        logger.info(f"Fetching videos from channel: {channel_info.get('snippet', {}).get('title', channel_id)}")
-        
         # Get videos from playlist
-        for video_item in self.get_playlist_videos(uploads_playlist_id, max_results):
+        for video_item in self.get_playlist_videos(playlist_id, max_results, published_after):
             video_id = video_item['snippet']['resourceId']['videoId']
             video_batch.append(video_id)
             
             # Process in batches of 50 (API limit)
             if len(video_batch) == 50:
-                detailed_videos = self.get_video_details(video_batch)
-                
-                for video in detailed_videos:
-                    enhanced_video = self._enhance_video_data(video, channel_info, include_comments_count)
-                    all_videos.append(enhanced_video)
-                
+                yield video_batch
                 video_batch = []
                 
                 # Rate limiting
@@ -281,23 +659,38 @@ class YouTubeDataAPI:
         
         # Process remaining videos
         if video_batch:
-            detailed_videos = self.get_video_details(video_batch)
+            yield video_batch
+    
+    def _get_enhanced_videos(self, video_ids: List[str], channel_info: Dict, include_comments_count: bool = False) -> List[Dict]:
+        """
+        Fetch the details of a batch of videos and enhance them.
+        
+        Args:
+            video_ids (List[str]): List of video IDs (max 50)
+            channel_info (Dict): Channel information
+            include_comments_count (bool): Whether to fetch comment counts
             
-            for video in detailed_videos:
-                enhanced_video = self._enhance_video_data(video, channel_info, include_comments_count)
-                all_videos.append(enhanced_video)
+        Returns:
+            List[Dict]: Enhanced video data
+        """
+        detailed_videos = self.get_video_details(video_ids)
+        enhanced_videos = [self._enhance_video_data(video, channel_info) for video in detailed_videos]
         
-        logger.info(f"Successfully fetched {len(all_videos)} videos")
-        return all_videos
+        # Optionally fetch comment count separately for more accuracy, once the whole batch is enhanced
+        if include_comments_count:
+            comment_counts = self.get_comment_counts([video['video_id'] for video in enhanced_videos if video['comment_count'] == 0])
+            for video in enhanced_videos:
+                video['comment_count'] = comment_counts.get(video['video_id'], video['comment_count'])
+        
+        return enhanced_videos
     
-    def _enhance_video_data(self, video: Dict, channel_info: Dict, include_comments_count: bool = False) -> Dict:
+    def _enhance_video_data(self, video: Dict, channel_info: Dict) -> Dict:
         """
         Enhance video data with additional computed fields and channel context.
         
         Args:
             video (Dict): Raw video data from API
             channel_info (Dict): Channel information
-            include_comments_count (bool): Whether to fetch comment counts
             
         Returns:
             Dict: Enhanced video data
@@ -318,6 +711,7 @@ class YouTubeDataAPI:
         
         enhanced_video = {
             'video_id': video['id'],
+            'etag': video.get('etag', ''),
             'title': snippet.get('title', ''),
             'description': snippet.get('description', ''),
             'published_at': published_at,
@@ -382,10 +776,6 @@ class YouTubeDataAPI:
                 enhanced_video['recording_longitude'] = recording_details['location'].get('longitude')
                 enhanced_video['recording_altitude'] = recording_details['location'].get('altitude')
         
-        # Optionally fetch comment count separately for more accuracy
-        if include_comments_count and enhanced_video['comment_count'] == 0:
-            enhanced_video['comment_count'] = self.get_video_comments_count(video['id'])
-        
         return enhanced_video
     
     def _parse_duration(self, duration_iso: str) -> int: